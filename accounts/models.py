@@ -8,6 +8,13 @@ from django.utils import timezone
 from datetime import timedelta
 
 
+# scraped users start with this password; the loader can store
+# DEFERRED_PASSWORD instead of hashing it for every new user, and the real
+# hash is made the first time the user logs in with it (or resets it)
+ONBOARDING_PASSWORD = "1234"
+DEFERRED_PASSWORD = "!onboarding"  # "!" prefix = unusable for Django
+
+
 class User(AbstractBaseUser, PermissionsMixin):
     ROLE_CHOICES = [
         ("SUPER_ADMIN", "Super Admin"),
@@ -40,6 +47,20 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return self.username
 
+    def set_deferred_password(self):
+        """ONBOARDING_PASSWORD without the hashing cost (see check_password)."""
+        self.password = DEFERRED_PASSWORD
+
+    def check_password(self, raw_password):
+        if self.password == DEFERRED_PASSWORD:
+            if raw_password != ONBOARDING_PASSWORD:
+                return False
+            # first login: hash the onboarding password for real
+            self.set_password(raw_password)
+            self.save(update_fields=["password"])
+            return True
+        return super().check_password(raw_password)
+
 
 class OTP(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
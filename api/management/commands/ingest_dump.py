@@ -0,0 +1,227 @@
+import json
+import multiprocessing
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from scripts.load_data import (
+    BULK_SAVE,
+    IdentityIndex,
+    prepare_manager,
+    save_manager_chunk,
+)
+
+# bytes read at a time from a JSON array dump
+READ_SIZE = 1 << 20
+SEPARATORS_RE = re.compile(r"[\s,]*")
+
+
+class ScrapeDump:
+    """
+    Managers of a scrape dump, one at a time:
+      - JSON: the OUTPUT_FILE list of scraper.py, decoded item by item
+      - JSONL: one manager per line (unsaved_managers.jsonl), or the
+        records of a scraper checkpoint (creators are collected per
+        manager until its "manager" record arrives)
+    `month` is set from a checkpoint's "run" record.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.month = None
+        self.bad_lines = 0
+
+    def __iter__(self):
+        with open(self.path, encoding="utf-8") as f:
+            first = f.read(1)
+            while first.isspace():
+                first = f.read(1)
+            if first == "[":
+                yield from self._array(f)
+            elif first == "{":
+                f.seek(0)
+                yield from self._lines(f)
+            elif first:
+                raise CommandError(f"{self.path} is not a JSON / JSONL scrape dump")
+
+    def _array(self, f):
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        eof = False
+        while True:
+            pos = SEPARATORS_RE.match(buffer, pos).end()
+            if buffer.startswith("]", pos):
+                return
+            if pos < len(buffer):
+                try:
+                    manager, pos = decoder.raw_decode(buffer, pos)
+                except ValueError:
+                    if eof:
+                        raise CommandError(f"{self.path} ends in a torn item")
+                else:
+                    yield manager
+                    continue
+            elif eof:
+                raise CommandError(f"{self.path} ends without ']'")
+            chunk = f.read(READ_SIZE)
+            eof = not chunk
+            # only the undecoded tail is kept
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+    def _lines(self, f):
+        pending = {}  # (manager, sidesheet page) -> creators
+        pages = {}  # manager -> {sidesheet page: creators}
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                self.bad_lines += 1  # torn line from a crash
+                continue
+
+            kind = record.get("type")
+            if kind is None:
+                yield record
+            elif kind == "run":
+                self.month = record.get("month")
+            elif kind == "creator":
+                key = (record["manager"], record["page"])
+                pending.setdefault(key, []).append(record["creator"])
+            elif kind == "creator_page":
+                key = (record["manager"], record["page"])
+                creators = pending.pop(key, [])
+                pages.setdefault(record["manager"], {})[record["page"]] = creators
+            elif kind == "manager":
+                manager = dict(record["manager"])
+                done = pages.pop(manager["Creator Network manager"], {})
+                manager["creators"] = [c for n in sorted(done) for c in done[n]]
+                yield manager
+
+
+class Command(BaseCommand):
+    help = "Load a JSON / JSONL scrape dump into the DB without scraping"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="OUTPUT_FILE, checkpoint or JSONL dump")
+        parser.add_argument(
+            "--month",
+            type=str,
+            help="Report month YYYYMM (default: the checkpoint's, else current)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Processes parsing managers ahead of the writer (0 = inline)",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"{path} not found")
+
+        self.dump = ScrapeDump(path)
+        self.month = options.get("month")
+        if self.month:
+            print(f"📅 Ingesting {path} into {self.month}")
+        self.failed_file = f"{path}.failed.jsonl"
+        self.identities = IdentityIndex(complete=True) if BULK_SAVE else None
+        self.totals = {
+            "managers": 0,
+            "failed": 0,
+            "creators": 0,
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "bad_cells": 0,
+        }
+
+        started = time.monotonic()
+        workers = options["workers"] if BULK_SAVE else 0
+        if workers < 1:
+            for manager_data in self.dump:
+                self.save(manager_data, None)
+        else:
+            self.ingest_parallel(workers)
+        self.print_summary(time.monotonic() - started)
+
+    def ingest_parallel(self, workers):
+        """
+        prepare_manager() (parsing + identity entries) runs in `workers`
+        processes while this process resolves and saves the managers in
+        dump order. At most 2 managers per worker are in flight, so memory
+        does not grow with the dump.
+        """
+        # spawn, like the loader's password pool
+        pool = ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        window = deque()
+        try:
+            for manager_data in self.dump:
+                window.append(
+                    (manager_data, pool.submit(prepare_manager, manager_data))
+                )
+                if len(window) >= workers * 2:
+                    self.save_next(window)
+            while window:
+                self.save_next(window)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def save_next(self, window):
+        manager_data, future = window.popleft()
+        self.save(manager_data, future.result())
+
+    def save(self, manager_data, prepared):
+        if self.month is None:
+            # the checkpoint's "run" record comes before its first manager
+            self.month = self.dump.month or timezone.now().strftime("%Y%m")
+            print(f"📅 Ingesting {self.dump.path} into {self.month}")
+
+        try:
+            report = save_manager_chunk(
+                manager_data,
+                self.month,
+                identities=self.identities,
+                prepared=prepared,
+            )
+        except Exception as e:
+            manager_name = manager_data.get("Creator Network manager")
+            print(f"❌ Ingest failed on {manager_name}: {e}")
+            self.totals["failed"] += 1
+            with open(self.failed_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(manager_data, ensure_ascii=False) + "\n")
+            return
+
+        self.totals["managers"] += 1
+        self.totals["creators"] += len(manager_data.get("creators", []))
+        if report:
+            for key in ("inserted", "updated", "unchanged"):
+                self.totals[key] += report[key]
+            self.totals["bad_cells"] += sum(
+                len(bad) for bad in report["errors"].values()
+            )
+
+    def print_summary(self, elapsed):
+        t = self.totals
+        rate = t["managers"] / elapsed if elapsed else 0
+        print(
+            f"\n🏁 Ingested {t['managers']} managers / {t['creators']} creators "
+            f"in {elapsed:.1f}s ({rate:.1f} managers/s)"
+        )
+        if BULK_SAVE:
+            print(
+                f"   creators: {t['inserted']} inserted, {t['updated']} updated, "
+                f"{t['unchanged']} unchanged, {t['bad_cells']} unreadable cells"
+            )
+        if self.dump.bad_lines:
+            print(f"⚠️ Skipped {self.dump.bad_lines} unreadable lines")
+        if t["failed"]:
+            print(f"⚠️ {t['failed']} managers failed → {self.failed_file}")
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from creators.models import Creator
+from creators.models import Creator, CreatorDailySnapshot
 
 # Register your models here.
 admin.site.register(Creator)
+admin.site.register(CreatorDailySnapshot)
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-17 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0005_alter_creator_unique_together_creator_creator_uid_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='creator',
+            name='metrics_digest',
+            field=models.CharField(blank=True, default='', max_length=40),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.1 on 2026-10-17 17:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0006_creator_metrics_digest'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreatorDailySnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('creator_uid', models.CharField(max_length=100)),
+                ('day', models.DateField()),
+                ('diamonds', models.IntegerField(default=0)),
+                ('live_duration', models.FloatField(default=0.0)),
+                ('valid_go_live_days', models.SmallIntegerField(default=0)),
+                ('bonus', models.FloatField(default=0.0)),
+                ('milestones', models.PositiveSmallIntegerField(default=0)),
+                ('manager_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='team_snapshots', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['manager_user', 'day'], name='creators_cr_manager_ce32b9_idx')],
+                'unique_together': {('creator_uid', 'day')},
+            },
+        ),
+    ]
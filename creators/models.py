@@ -25,6 +25,9 @@ class Creator(models.Model):
     diamonds = models.IntegerField(default=0)
     valid_go_live_days = models.IntegerField(default=0)
     live_duration = models.FloatField(default=0.0)
+    # sha1 of the loaded values (scripts/load_data.py), unchanged rows are
+    # not rewritten
+    metrics_digest = models.CharField(max_length=40, blank=True, default="")
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -38,3 +41,41 @@ class Creator(models.Model):
 
     def __str__(self):
         return f"{self.user.username} ({self.manager.user.username} - {self.report_month.code})"
+
+
+# milestone name -> bit of CreatorDailySnapshot.milestones
+MILESTONE_BITS = {"M0.5": 1, "M1": 2, "M1R": 4, "M2": 8}
+
+
+class CreatorDailySnapshot(models.Model):
+    """
+    A creator's month-to-date metrics as of one day, upserted by the loader
+    (scripts/load_data.py) whenever the creator's Creator row changes.
+    Read by creators/snapshots.py.
+    """
+
+    creator_uid = models.CharField(max_length=100)
+    day = models.DateField()
+    # the User, not the month's Manager row, so a team spans months
+    manager_user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="team_snapshots",
+    )
+
+    diamonds = models.IntegerField(default=0)
+    live_duration = models.FloatField(default=0.0)
+    valid_go_live_days = models.SmallIntegerField(default=0)
+    bonus = models.FloatField(default=0.0)
+    milestones = models.PositiveSmallIntegerField(default=0)  # MILESTONE_BITS
+
+    class Meta:
+        unique_together = ("creator_uid", "day")  # also the creator range index
+        indexes = [
+            models.Index(fields=["manager_user", "day"]),
+        ]
+
+    def __str__(self):
+        return f"{self.creator_uid} @ {self.day}"
@@ -0,0 +1,111 @@
+from datetime import timedelta
+from creators.models import CreatorDailySnapshot, MILESTONE_BITS
+
+SNAPSHOT_METRICS = ("diamonds", "live_duration", "valid_go_live_days", "bonus")
+
+
+def milestone_bits(milestones):
+    bits = 0
+    for name in milestones or []:
+        bits |= MILESTONE_BITS.get(name, 0)
+    return bits
+
+
+def milestone_names(bits):
+    return [name for name, bit in MILESTONE_BITS.items() if bits & bit]
+
+
+def _round(value):
+    return round(value, 2) if isinstance(value, float) else value
+
+
+def same_month(a, b):
+    return (a.year, a.month) == (b.year, b.month)
+
+
+def scan_snapshots(start, end, **filters):
+    """
+    One range scan over CreatorDailySnapshot, from the 1st of start's month
+    (the baseline of the first deltas) to end.
+    filters: creator_uid=... or manager_user_id=...
+    """
+    return (
+        CreatorDailySnapshot.objects.filter(
+            day__range=(start.replace(day=1), end), **filters
+        )
+        .order_by("day")
+        .values_list("creator_uid", "day", *SNAPSHOT_METRICS, "milestones")
+    )
+
+
+def build_trajectories(rows, start, end):
+    """
+    rows: scan_snapshots() tuples.
+    Returns {creator_uid: [point, ...]}, one point per day from start to end.
+
+    Snapshots are month-to-date, so a day without one repeats the last
+    value of the same month ("reported": False) and the deltas are the
+    change since the previous day. The first day of a month is compared
+    with zero; days of a month before its first snapshot are left out.
+    """
+    by_creator = {}
+    for creator_uid, day, *values in rows:
+        by_creator.setdefault(creator_uid, {})[day] = values
+
+    trajectories = {}
+    for creator_uid, days in by_creator.items():
+        points = []
+        last = None  # (day, values) of the last snapshot seen
+        day = start.replace(day=1)
+        while day <= end:
+            values = days.get(day)
+            reported = values is not None
+            if not reported and last and same_month(last[0], day):
+                values = last[1]
+
+            if values is not None:
+                previous = last[1] if last and same_month(last[0], day) else None
+                if day >= start:
+                    point = {"day": day, "reported": reported}
+                    for i, metric in enumerate(SNAPSHOT_METRICS):
+                        point[metric] = values[i]
+                        point[f"{metric}_delta"] = _round(
+                            values[i] - (previous[i] if previous else 0)
+                        )
+                    point["milestones"] = milestone_names(values[-1])
+                    points.append(point)
+                last = (day, values)
+
+            day += timedelta(days=1)
+        trajectories[creator_uid] = points
+    return trajectories
+
+
+def team_totals(trajectories):
+    """Per-day sums of the creators' trajectories (metrics and deltas)."""
+    totals = {}
+    for points in trajectories.values():
+        for point in points:
+            total = totals.setdefault(
+                point["day"], {"day": point["day"], "creators": 0}
+            )
+            total["creators"] += 1
+            for metric in SNAPSHOT_METRICS:
+                for key in (metric, f"{metric}_delta"):
+                    total[key] = _round(total.get(key, 0) + point[key])
+    return [totals[day] for day in sorted(totals)]
+
+
+def creator_trajectory(creator_uid, start, end, manager_user_id=None):
+    filters = {"creator_uid": creator_uid}
+    if manager_user_id is not None:
+        filters["manager_user_id"] = manager_user_id
+    trajectories = build_trajectories(scan_snapshots(start, end, **filters), start, end)
+    return trajectories.get(creator_uid, [])
+
+
+def team_trajectory(manager_user_id, start, end):
+    trajectories = build_trajectories(
+        scan_snapshots(start, end, manager_user_id=manager_user_id), start, end
+    )
+    return {"team": team_totals(trajectories), "creators": trajectories}
@@ -1,7 +1,14 @@
 from django.urls import path
-from creators.views import CreatorListView, CreatorDetailView
+from creators.views import (
+    CreatorListView,
+    CreatorDetailView,
+    CreatorHistoryView,
+    TeamHistoryView,
+)
 
 urlpatterns = [
     path("", CreatorListView.as_view(), name="creator-list"),
     path("<int:pk>/", CreatorDetailView.as_view(), name="creator-detail"),
+    path("history/", CreatorHistoryView.as_view(), name="creator-history"),
+    path("team-history/", TeamHistoryView.as_view(), name="team-history"),
 ]
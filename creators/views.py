@@ -1,7 +1,12 @@
 from rest_framework import generics, permissions
+from rest_framework.views import APIView
+from rest_framework.response import Response
 from creators.models import Creator
 from creators.serializers import CreatorSerializer
+from creators.snapshots import creator_trajectory, team_trajectory
+from api.permissions import IsAdmin, IsCreator, IsManager
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -77,3 +82,130 @@ class CreatorDetailView(generics.RetrieveAPIView):
     )
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
+
+
+# longest start..end a history request may scan
+HISTORY_MAX_DAYS = 366
+
+HISTORY_DATE_PARAMETERS = [
+    openapi.Parameter(
+        name="start",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        description="First day YYYY-MM-DD (default: 1st of the current month)",
+        required=False,
+        example="2026-01-01",
+    ),
+    openapi.Parameter(
+        name="end",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        description="Last day YYYY-MM-DD (default: today)",
+        required=False,
+        example="2026-01-31",
+    ),
+]
+
+
+def get_history_range(request):
+    """(start, end) from the query params, or raises ValueError."""
+    today = timezone.localdate()
+    start = request.GET.get("start")
+    end = request.GET.get("end")
+    start = parse_date(start) if start else today.replace(day=1)
+    end = parse_date(end) if end else today
+    if not start or not end:
+        raise ValueError("Dates must be YYYY-MM-DD")
+    if start > end:
+        raise ValueError("start is after end")
+    if (end - start).days >= HISTORY_MAX_DAYS:
+        raise ValueError(f"At most {HISTORY_MAX_DAYS} days per request")
+    return start, end
+
+
+class CreatorHistoryView(APIView):
+    """
+    Day-by-day trajectory of one creator from the daily snapshots
+    """
+
+    permission_classes = [IsCreator | IsManager | IsAdmin]
+
+    @swagger_auto_schema(
+        operation_summary="Creator daily history (values + per-day deltas)",
+        tags=["Creators"],
+        manual_parameters=[
+            openapi.Parameter(
+                name="creator_uid",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Creator UID (Manager/Admin; a creator always gets their own)",
+                required=False,
+            ),
+            *HISTORY_DATE_PARAMETERS,
+        ],
+    )
+    def get(self, request):
+        try:
+            start, end = get_history_range(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+
+        user = request.user
+        manager_user_id = None
+        if user.role == "CREATOR":
+            creator_uid = user.uid
+        else:
+            creator_uid = request.GET.get("creator_uid")
+            if user.role == "MANAGER":
+                # only creators while they were in this manager's team
+                manager_user_id = user.id
+        if not creator_uid:
+            return Response({"error": "creator_uid is required"}, status=400)
+
+        points = creator_trajectory(
+            creator_uid, start, end, manager_user_id=manager_user_id
+        )
+        return Response(
+            {"creator_uid": creator_uid, "start": start, "end": end, "days": points}
+        )
+
+
+class TeamHistoryView(APIView):
+    """
+    Day-by-day trajectories of a manager's creators and the team totals
+    """
+
+    permission_classes = [IsManager | IsAdmin]
+
+    @swagger_auto_schema(
+        operation_summary="Team daily history (team totals + every creator)",
+        tags=["Creators"],
+        manual_parameters=[
+            openapi.Parameter(
+                name="manager_user_id",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_INTEGER,
+                description="User ID of the manager (Admin only, required)",
+                required=False,
+            ),
+            *HISTORY_DATE_PARAMETERS,
+        ],
+    )
+    def get(self, request):
+        try:
+            start, end = get_history_range(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+
+        if request.user.role == "MANAGER":
+            manager_user_id = request.user.id
+        else:
+            manager_user_id = request.GET.get("manager_user_id")
+            if not manager_user_id or not manager_user_id.isdigit():
+                return Response({"error": "manager_user_id is required"}, status=400)
+            manager_user_id = int(manager_user_id)
+
+        data = team_trajectory(manager_user_id, start, end)
+        return Response(
+            {"manager_user_id": manager_user_id, "start": start, "end": end, **data}
+        )
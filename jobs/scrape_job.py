@@ -14,18 +14,87 @@ import django
 
 django.setup()
 
-from scripts.load_data import scrape_dashboard, save_manager_chunk
+from scripts import scraper
+from scripts.load_data import ManagerWriter, scrape_dashboard, save_manager_chunk
 
 
-def run():
+def run(resume=False, incremental=None, retry_failed=False, pipelined=True):
     month = datetime.now().strftime("%Y%m")
     # month = "202601"
     print("🚀 Scraper started for month:", month)
 
-    scrape_dashboard(on_manager=lambda m: save_manager_chunk(m, month))
+    def scrape(on_manager):
+        scrape_dashboard(
+            on_manager=on_manager,
+            resume=resume,
+            incremental=incremental,
+            retry_failed=retry_failed,
+        )
 
+    if pipelined:
+        # DB writes run on a writer thread while the browser keeps going
+        with ManagerWriter(month) as writer:
+            scrape(writer)
+    else:
+        scrape(lambda m: save_manager_chunk(m, month))
+
+    print_summary(scraper.last_run_summary)
     print("✅ Scraper finished")
 
 
+def backfill(first, last, resume=False, incremental=None, pipelined=True):
+    """Re-scrape every month from `first` to `last` (YYYYMM), oldest first."""
+    months = scraper.month_range(first, last)
+    print(f"🚀 Backfill started for {len(months)} months: {first} → {last}")
+
+    for month in months:
+        with scraper.use_month(month):
+            print(f"\n🗓️ Month {month}")
+            if pipelined:
+                with ManagerWriter(month) as writer:
+                    scrape_dashboard(
+                        on_manager=writer, resume=resume, incremental=incremental
+                    )
+            else:
+                scrape_dashboard(
+                    on_manager=lambda m, month=month: save_manager_chunk(m, month),
+                    resume=resume,
+                    incremental=incremental,
+                )
+            print_summary(scraper.last_run_summary)
+    print("✅ Backfill finished")
+
+
+def print_summary(summary):
+    if summary:
+        print(
+            f"📊 {summary['month']}: {summary['managers_delivered']} managers, "
+            f"{summary['managers_failed']} failed in {summary['wall_seconds']}s "
+            f"(telemetry: {scraper.telemetry.summary_path})"
+        )
+
+
+def _arg(name):
+    return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else None
+
+
 if __name__ == "__main__":
-    run()
+    # python jobs/scrape_job.py --months 202510:202601 [--resume]
+    months = _arg("--months")
+    if months:
+        first, _, last = months.partition(":")
+        backfill(
+            first,
+            last or first,
+            resume="--resume" in sys.argv,
+            incremental=True if "--incremental" in sys.argv else None,
+            pipelined="--sync-writes" not in sys.argv,
+        )
+        sys.exit(0)
+
+    run(
+        resume="--resume" in sys.argv,
+        incremental=True if "--incremental" in sys.argv else None,
+        retry_failed="--retry-failed" in sys.argv,
+        pipelined="--sync-writes" not in sys.argv,
+    )
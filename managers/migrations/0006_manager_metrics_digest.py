@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-17 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('managers', '0005_manager_manager_uid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='manager',
+            name='metrics_digest',
+            field=models.CharField(blank=True, default='', max_length=40),
+        ),
+    ]
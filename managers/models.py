@@ -23,6 +23,9 @@ class Manager(models.Model):
     M1 = models.IntegerField(default=0)
     M2 = models.IntegerField(default=0)
     M1R = models.IntegerField(default=0)
+    # sha1 of the loaded values (scripts/load_data.py), unchanged rows are
+    # not rewritten
+    metrics_digest = models.CharField(max_length=40, blank=True, default="")
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
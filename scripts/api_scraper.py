@@ -0,0 +1,361 @@
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from playwright.sync_api import sync_playwright
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from scripts import scraper
+from scripts.scraper import (
+    CREATOR_API_FIELDS,
+    MANAGER_RETRIES,
+    _api_value,
+    _find_rows,
+    build_creator,
+    creator_from_api,
+    manager_from_api,
+    normalize_creator,
+    telemetry,
+)
+
+# Browserless mode: the list endpoints behind the dashboard are called
+# directly with the cookies of STATE_FILE. Playwright is only started to
+# refresh STATE_FILE when the API stops accepting the session.
+#
+# Paths / parameter names are the ones in the portal's network tab; the host
+# and the task query (Month, TaskID, ...) come from DASHBOARD_URL.
+MANAGER_LIST_PATH = "/api/v1/revenue/task/manager_list"
+CREATOR_LIST_PATH = "/api/v1/revenue/task/anchor_list"
+ANCHOR_PROFILE_PATH = "/api/v1/revenue/anchor_profile"
+API_PAGE_PARAM = "page"
+API_PAGE_SIZE_PARAM = "page_size"
+API_MANAGER_PARAM = "manager_id"
+API_PROFILE_PARAM = "display_id"
+API_PAGE_SIZE = 50
+MANAGER_ID_FIELDS = ("ManagerID", "AgentID", "manager_id")
+
+API_MANAGER_WORKERS = 4  # managers scraped side by side
+API_PAGE_WORKERS = 8  # list pages / profiles fetched side by side
+API_TIMEOUT = 20  # seconds per request
+API_MIN_INTERVAL = 0.05  # seconds between two requests of the process
+API_AUTH_REFRESHES = 2  # session refreshes per run before giving up
+API_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+
+
+class BackstageApiClient:
+    """
+    Pooled requests.Session carrying the cookies of STATE_FILE.
+    Transient 429/5xx answers are retried by the adapter; an auth error
+    refreshes the session once through Playwright and repeats the request.
+    """
+
+    def __init__(self):
+        url = urlparse(scraper.DASHBOARD_URL)
+        self.base = f"{url.scheme}://{url.netloc}"
+        # the task the dashboard shows (Month, SettleJobID, TaskID, ...)
+        self.task_params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        self.session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=API_PAGE_WORKERS,
+            pool_maxsize=API_PAGE_WORKERS + API_MANAGER_WORKERS,
+            max_retries=retry,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {
+                "User-Agent": API_USER_AGENT,
+                "Accept": "application/json, text/plain, */*",
+                "Referer": scraper.DASHBOARD_URL,
+            }
+        )
+
+        self.pages = ThreadPoolExecutor(API_PAGE_WORKERS, "api-page")
+        self.generation = 0
+        self.refreshes = 0
+        self.refresh_lock = threading.Lock()
+        self.pace_lock = threading.Lock()
+        self.next_request = 0.0
+        self.load_cookies()
+
+    def load_cookies(self):
+        with open(scraper.STATE_FILE, encoding="utf-8") as f:
+            state = json.load(f)
+        self.session.cookies.clear()
+        for cookie in state.get("cookies", []):
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    def refresh_session(self, generation):
+        """Re-open the dashboard with Playwright and save the new cookies."""
+        with self.refresh_lock:
+            if generation != self.generation:
+                return  # another thread already refreshed
+            if self.refreshes >= API_AUTH_REFRESHES:
+                raise RuntimeError("Backstage API keeps rejecting the session")
+            self.refreshes += 1
+            telemetry.count("api_session_refreshes")
+            print("🔑 API session rejected → refreshing state.json")
+
+            with sync_playwright() as p:
+                browser = scraper.launch_browser(p)
+                ctx = browser.new_context(storage_state=scraper.STATE_FILE)
+                page = ctx.new_page()
+                page.goto(scraper.DASHBOARD_URL)
+                scraper.wait_for_dashboard(page)
+                ctx.storage_state(path=scraper.STATE_FILE)
+                scraper.close_browser(browser)
+
+            self.load_cookies()
+            self.generation += 1
+
+    def _pace(self):
+        with self.pace_lock:
+            now = time.monotonic()
+            wait = self.next_request - now
+            self.next_request = max(now, self.next_request) + API_MIN_INTERVAL
+        if wait > 0:
+            time.sleep(wait)
+
+    @staticmethod
+    def is_auth_error(response):
+        if response.status_code in (401, 403):
+            return True
+        # an expired session is redirected to the login page (HTML)
+        content_type = response.headers.get("Content-Type", "")
+        return "login" in response.url or "text/html" in content_type
+
+    def get_json(self, path, params, name):
+        for _ in range(2):
+            generation = self.generation
+            self._pace()
+            start = time.monotonic()
+            response = self.session.get(
+                self.base + path,
+                params={**self.task_params, **params},
+                timeout=API_TIMEOUT,
+            )
+            telemetry.observe(name, time.monotonic() - start, response.status_code)
+
+            if not self.is_auth_error(response):
+                response.raise_for_status()
+                return response.json()
+            self.refresh_session(generation)
+
+        raise RuntimeError(f"{name}: still unauthorized after a session refresh")
+
+    def list_all(self, path, params, name):
+        """Every row of a paged list endpoint, pages 2..n fetched concurrently."""
+
+        def fetch(page):
+            payload = self.get_json(
+                path,
+                {**params, API_PAGE_PARAM: page, API_PAGE_SIZE_PARAM: API_PAGE_SIZE},
+                name,
+            )
+            return payload, _find_rows(payload)
+
+        payload, rows = fetch(1)
+        rows = list(rows)
+        total = _find_total(payload)
+        if total is not None:
+            pages = math.ceil(total / API_PAGE_SIZE)
+            for more in self.pages.map(lambda n: fetch(n)[1], range(2, pages + 1)):
+                rows.extend(more)
+            return rows
+
+        # no total in the payload -> walk until a short page
+        page = 1
+        last = rows
+        while len(last) >= API_PAGE_SIZE:
+            page += 1
+            last = fetch(page)[1]
+            rows.extend(last)
+        return rows
+
+    def anchor_profile(self, creator_name):
+        """normalize_creator() of the profile, None when it can't be read."""
+        try:
+            payload = self.get_json(
+                ANCHOR_PROFILE_PATH, {API_PROFILE_PARAM: creator_name}, "anchor_profile"
+            )
+        except requests.RequestException as e:
+            print(f"❌ Profile request failed for {creator_name}: {e}")
+            return None
+        return normalize_creator(payload)
+
+    def close(self):
+        self.pages.shutdown(wait=True)
+        self.session.close()
+
+
+def _find_total(payload):
+    """The row count of a list payload ("total" somewhere inside), or None."""
+    queue = [payload]
+    while queue:
+        node = queue.pop(0)
+        if isinstance(node, dict):
+            for key in ("total", "Total", "total_count", "TotalCount"):
+                value = node.get(key)
+                if isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
+                    return int(value)
+            queue.extend(v for v in node.values() if isinstance(v, (dict, list)))
+    return None
+
+
+def read_creators(client, manager, manager_id, identities):
+    manager_name = manager["Creator Network manager"]
+    items = client.list_all(
+        CREATOR_LIST_PATH, {API_MANAGER_PARAM: manager_id}, "anchor_list"
+    )
+
+    creators = []
+    missing = []  # (index, creator) without CreatorID in the list row
+    for item in items:
+        creator = creator_from_api(item)
+        if not creator["Creator"]:
+            continue
+        if creator["CreatorID"] in ("", "N/A"):
+            cached = identities.get(manager_name, creator["Creator"]) if identities else None
+            if cached:
+                cells = {column: creator[column] for column in CREATOR_API_FIELDS}
+                creator = build_creator(creator["Creator"], cells, cached)
+            else:
+                missing.append((len(creators), creator))
+        elif identities:
+            identities.put(manager_name, creator["Creator"], normalize_creator(item))
+        creators.append(creator)
+
+    # profile lookups for the rest, side by side
+    profiles = client.pages.map(
+        lambda pair: client.anchor_profile(pair[1]["Creator"]), missing
+    )
+    skipped = set()
+    for (index, creator), identity in zip(missing, profiles):
+        if identity is None:
+            skipped.add(index)  # same as a failed profile XHR in the browser
+            continue
+        if identities:
+            identities.put(manager_name, creator["Creator"], identity)
+        cells = {column: creator[column] for column in CREATOR_API_FIELDS}
+        creators[index] = build_creator(creator["Creator"], cells, identity)
+
+    return [c for i, c in enumerate(creators) if i not in skipped]
+
+
+def scrape_manager(client, run, manager, manager_id):
+    manager_name = manager["Creator Network manager"]
+    print("➡️", manager_name)
+
+    error = None
+    for attempt in range(1, MANAGER_RETRIES + 1):
+        try:
+            with telemetry.stage("manager", manager=manager_name, attempt=attempt):
+                manager["creators"] = read_creators(
+                    client, manager, manager_id, run.identities
+                )
+            error = None
+            break
+        except Exception as e:
+            error = e
+            print(f"❌ {manager_name} attempt {attempt}/{MANAGER_RETRIES} failed: {e}")
+
+    if error is not None:
+        telemetry.count("manager_failures", manager=manager_name)
+        run.fail(manager, error)
+        return
+    run.emit(manager)
+
+
+def scrape_managers(client, run):
+    items = client.list_all(MANAGER_LIST_PATH, {}, "manager_list")
+    print(f"📄 {len(items)} managers from the API")
+
+    with ThreadPoolExecutor(API_MANAGER_WORKERS, "api-manager") as pool:
+        futures = []
+        for item in items:
+            manager = manager_from_api(item)
+            manager_name = manager["Creator Network manager"]
+            if not manager_name or not run.wanted(manager_name):
+                continue
+            if run.is_done(manager_name):
+                print("⏭️", manager_name, "(already done)")
+                continue
+            if run.unchanged(manager):
+                print("⏭️", manager_name, "(unchanged)")
+                continue
+            if manager["Eligible creators"] == "0":
+                run.emit(manager)
+                continue
+
+            manager_id = _api_value(item, MANAGER_ID_FIELDS)
+            futures.append(pool.submit(scrape_manager, client, run, manager, manager_id))
+
+        for future in futures:
+            future.result()
+
+
+def scrape_dashboard_api(
+    on_manager=None,
+    resume=False,
+    incremental=None,
+    refresh_identities=False,
+    retry_failed=False,
+):
+    """Same output contract as scraper.scrape_dashboard(), without a browser."""
+    print("🌐 API scrape (no browser)")
+    run = scraper.start_run(
+        on_manager, resume, incremental, refresh_identities, retry_failed
+    )
+    if run.only is not None and not run.only:
+        print("✅ No failed managers to retry.")
+        run.close()
+        return []
+
+    client = BackstageApiClient()
+    try:
+        scrape_managers(client, run)
+        if run.only is not None:
+            run.mark_missing()
+
+        if run.failed and scraper.RETRY_FAILED_AT_END:
+            print(f"\n🔁 Re-scraping {len(run.failed)} failed managers")
+            run.only = set(run.failed)
+            run.failed = {}
+            scrape_managers(client, run)
+            run.mark_missing()
+            run.only = None
+    finally:
+        client.close()
+        run.close()
+
+    print(f"\n✅ DONE. Total managers: {len(run.final_data)}")
+    return run.final_data
+
+
+if __name__ == "__main__":
+    scrape_dashboard_api(resume="--resume" in sys.argv)
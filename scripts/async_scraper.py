@@ -0,0 +1,514 @@
+import asyncio
+import inspect
+import os
+import sys
+import time
+from playwright.async_api import async_playwright, TimeoutError
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from scripts import scraper
+from scripts.scraper import (
+    CREATOR_API_FIELDS,
+    CREATOR_COLUMNS,
+    CREATOR_ROW_SELECTOR,
+    EXTRACT_ROWS_JS,
+    IdentityCache,
+    MANAGER_ROW_SELECTOR,
+    ManagerPageQueue,
+    SIDESHEET_SELECTOR,
+    WAIT_ROWS_JS,
+    _find_rows,
+    build_creator,
+    build_manager,
+    creator_from_api,
+    manager_from_api,
+    normalize_creator,
+    pacer,
+    save_progress,
+    should_block,
+)
+
+# pages (tabs) of one browser context scraping manager pages concurrently
+CONCURRENCY = 4
+# finished managers waiting for on_manager before the scrapers block
+SINK_MAXSIZE = 8
+
+
+# ---------------- UTILITIES ----------------
+
+
+async def human_delay(a=800, b=1500):
+    await asyncio.sleep(pacer.delay_for(a, b))
+
+
+async def wait_for_rows(page, selector, previous=None, timeout=None):
+    timeout = timeout or scraper.ROWS_DEADLINE
+    try:
+        handle = await page.wait_for_function(
+            WAIT_ROWS_JS, arg=[selector, previous], polling=100, timeout=timeout
+        )
+        return await handle.json_value()
+    except TimeoutError:
+        print(f"⚠️ rows did not change within {timeout}ms")
+        pacer.record_timeout()
+        return previous
+
+
+async def rows_signature(page, selector):
+    return await page.evaluate(WAIT_ROWS_JS, [selector, None]) or ""
+
+
+async def close_modal(page):
+    try:
+        btn = page.locator(
+            'button.semi-sidesheet-close, button[aria-label="Close"]'
+        ).first
+        if await btn.count():
+            await btn.click()
+        else:
+            await page.keyboard.press("Escape")
+    except:
+        await page.keyboard.press("Escape")
+
+    try:
+        await page.wait_for_selector(
+            SIDESHEET_SELECTOR, state="hidden", timeout=scraper.SIDESHEET_DEADLINE
+        )
+    except TimeoutError:
+        print("⚠️ sidesheet still open, pressing Escape")
+        await page.keyboard.press("Escape")
+
+
+class ManagerSink:
+    """
+    Bounded hand-off between the page coroutines and on_manager.
+    on_manager may be a coroutine function (awaited) or a plain function
+    (run in a thread), either way it runs while the browser keeps working.
+    """
+
+    def __init__(self, on_manager, maxsize=SINK_MAXSIZE, identities=None):
+        self.on_manager = on_manager
+        self.identities = identities
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.final_data = []
+        self.emitted = set()
+        self.consumer = asyncio.create_task(self._consume())
+
+    async def put(self, manager):
+        if self.consumer.done():
+            # surface the on_manager error in the scraping coroutine
+            self.consumer.result()
+
+        # a retried page re-scrapes managers that already went out
+        if manager["Creator Network manager"] in self.emitted:
+            return
+        self.emitted.add(manager["Creator Network manager"])
+
+        put = asyncio.ensure_future(self.queue.put(manager))
+        await asyncio.wait({put, self.consumer}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            self.consumer.result()
+
+    async def _consume(self):
+        while True:
+            manager = await self.queue.get()
+            if manager is None:
+                return
+
+            if self.on_manager is None:
+                self.final_data.append(manager)
+                save_progress(self.final_data)
+            elif inspect.iscoroutinefunction(self.on_manager):
+                await self.on_manager(manager)
+            else:
+                await asyncio.to_thread(self.on_manager, manager)
+
+    async def close(self):
+        if not self.consumer.done():
+            await self.queue.put(None)
+        await self.consumer
+
+
+# ---------------- LIST API CAPTURE ----------------
+
+
+class ListApiCollector:
+    """Async twin of scraper.ListApiCollector."""
+
+    def __init__(self, page):
+        self.page = page
+        self.responses = {"manager": [], "creator": []}
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if scraper.MANAGER_LIST_API in response.url:
+            self.responses["manager"].append(response)
+        elif scraper.CREATOR_LIST_API in response.url:
+            self.responses["creator"].append(response)
+
+    def clear(self, kind):
+        self.responses[kind].clear()
+
+    async def take(self, kind, timeout=None):
+        timeout = timeout or scraper.LIST_API_TIMEOUT
+        deadline = time.monotonic() + timeout / 1000
+        while not self.responses[kind]:
+            if time.monotonic() > deadline:
+                pacer.record_timeout()
+                raise TimeoutError(f"No {kind} list response within {timeout}ms")
+            await asyncio.sleep(0.05)
+
+        response = self.responses[kind].pop(0)
+        if response.status != 200:
+            raise TimeoutError(f"{kind} list API returned {response.status}")
+        return _find_rows(await response.json())
+
+
+# ---------------- PAGE SCRAPERS ----------------
+
+
+async def fetch_creator_identity(page, crow, creator_name):
+    """Hover the avatar and read the anchor_profile XHR it triggers."""
+    await crow.scroll_into_view_if_needed()
+    await page.mouse.move(0, 0)
+
+    try:
+        async with page.expect_response(
+            lambda r: "anchor_profile" in r.url,
+            timeout=5000,
+        ) as resp:
+            await crow.locator("span.avatarContainer-yJA0K2").hover(force=True)
+
+        response = await resp.value
+        text = await response.text()
+        status = response.status
+
+        if status != 200:
+            print(f"❌ Non-200 response ({status}) for {creator_name}")
+            print(text[:300])
+            return None
+
+        if not text.strip():
+            print(f"⚠️ Empty response body for {creator_name}")
+            return None
+
+        try:
+            data = await response.json()
+        except Exception as e:
+            print(f"❌ JSON decode failed for {creator_name}: {e}")
+            print("Response preview:", text[:300])
+            return None
+
+        creator_xhr = normalize_creator(data)
+
+        print(
+            f" XHR OK: {creator_xhr.get('AgentName')} | "
+            f"{creator_xhr.get('CreatorID')}"
+        )
+        return creator_xhr
+
+    except TimeoutError:
+        print("⚠️ XHR timeout:", creator_name)
+        pacer.record_timeout()
+        return {}
+
+
+async def read_manager_rows_dom(page):
+    rows = page.locator(scraper.MANAGER_ROW_SELECTOR)
+    managers = []
+
+    for data in await page.evaluate(EXTRACT_ROWS_JS, scraper.MANAGER_ROW_SELECTOR):
+        if data["rowindex"] == "0":
+            continue
+
+        manager = build_manager(data["cells"])
+        manager_name = manager["Creator Network manager"]
+        if not manager_name or manager_name.lower() == "creator network manager":
+            continue
+
+        managers.append((manager, rows.nth(data["index"])))
+    return managers
+
+
+async def read_manager_rows_network(page, collector):
+    managers = []
+    for item in await collector.take("manager"):
+        manager = manager_from_api(item)
+        manager_name = manager["Creator Network manager"]
+        if not manager_name:
+            continue
+        managers.append((manager, scraper.find_manager_row(page, manager_name)))
+    return managers
+
+
+async def lookup_creator_identity(page, crow, manager_name, creator_name, identities):
+    if identities:
+        cached = identities.get(manager_name, creator_name)
+        if cached:
+            return cached
+
+    creator_xhr = await fetch_creator_identity(page, crow, creator_name)
+    if identities and creator_xhr:
+        identities.put(manager_name, creator_name, creator_xhr)
+    return creator_xhr
+
+
+async def scrape_creator_page_dom(page, manager, identities=None):
+    crows = page.locator(scraper.CREATOR_ROW_SELECTOR)
+
+    for data in await page.evaluate(EXTRACT_ROWS_JS, scraper.CREATOR_ROW_SELECTOR):
+        creator_name = data["cells"].get("1", "")
+
+        if not creator_name or creator_name.lower() == "creator":
+            continue
+
+        crow = crows.nth(data["index"])
+        creator_xhr = await lookup_creator_identity(
+            page, crow, manager["Creator Network manager"], creator_name, identities
+        )
+        if creator_xhr is None:
+            continue
+
+        cells = {
+            column: data["cells"].get(i, "") for i, column in CREATOR_COLUMNS.items()
+        }
+        manager["creators"].append(build_creator(creator_name, cells, creator_xhr))
+
+
+async def scrape_creator_page_network(page, manager, collector, identities=None):
+    manager_name = manager["Creator Network manager"]
+
+    for item in await collector.take("creator"):
+        creator = creator_from_api(item)
+        if not creator["Creator"]:
+            continue
+
+        if creator["CreatorID"] in ("", "N/A"):
+            crow = scraper.find_creator_row(page, creator["Creator"])
+            creator_xhr = await lookup_creator_identity(
+                page, crow, manager_name, creator["Creator"], identities
+            )
+            if creator_xhr is None:
+                continue
+            cells = {column: creator[column] for column in CREATOR_API_FIELDS}
+            creator = build_creator(creator["Creator"], cells, creator_xhr)
+
+        manager["creators"].append(creator)
+
+
+async def scrape_sidesheet(page, manager, collector=None, identities=None):
+    signature = None
+
+    while True:
+        signature = await wait_for_rows(page, CREATOR_ROW_SELECTOR, signature)
+
+        if collector:
+            await scrape_creator_page_network(page, manager, collector, identities)
+        else:
+            await scrape_creator_page_dom(page, manager, identities)
+
+        next_btn = page.locator(
+            '[role="dialog"] .semi-page-next,' " .semi-sidesheet .semi-page-next"
+        ).first
+
+        if (
+            not await next_btn.count()
+            or await next_btn.get_attribute("aria-disabled") == "true"
+        ):
+            break
+
+        if collector:
+            collector.clear("creator")
+        await next_btn.click()
+        await human_delay(1200, 1800)
+
+
+async def scrape_manager_page(page, collector, sink):
+    if collector:
+        manager_rows = await read_manager_rows_network(page, collector)
+    else:
+        manager_rows = await read_manager_rows_dom(page)
+
+    for manager, row in manager_rows:
+        print("➡️", manager["Creator Network manager"])
+
+        if manager["Eligible creators"] == "0":
+            await sink.put(manager)
+            continue
+
+        btn = row.locator('[aria-colindex="3"] button')
+        if not await btn.count():
+            await sink.put(manager)
+            continue
+
+        if collector:
+            collector.clear("creator")
+        await btn.click()
+
+        try:
+            await page.wait_for_selector(
+                SIDESHEET_SELECTOR, timeout=scraper.SIDESHEET_DEADLINE
+            )
+        except:
+            await sink.put(manager)
+            continue
+
+        await scrape_sidesheet(page, manager, collector, sink.identities)
+
+        await close_modal(page)
+        await sink.put(manager)
+        await human_delay(800, 1200)
+
+    return len(manager_rows)
+
+
+async def goto_next_manager_page(page, collector):
+    next_page = page.locator("#task-v2-page .semi-page-next").first
+    if (
+        not await next_page.count()
+        or await next_page.get_attribute("aria-disabled") == "true"
+    ):
+        return False
+
+    signature = await rows_signature(page, MANAGER_ROW_SELECTOR)
+    if collector:
+        collector.clear("manager")
+    await next_page.click()
+    await wait_for_rows(page, MANAGER_ROW_SELECTOR, signature)
+    await human_delay(1500, 2200)
+    return True
+
+
+async def block_heavy_requests(route):
+    if should_block(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def wait_for_dashboard(page):
+    await page.wait_for_selector(
+        '[role="row"][aria-rowindex]', timeout=scraper.LOAD_DEADLINE
+    )
+    await wait_for_rows(page, MANAGER_ROW_SELECTOR)
+    try:
+        await page.wait_for_selector(
+            "#task-v2-page .semi-page-next",
+            state="attached",
+            timeout=scraper.LOAD_DEADLINE,
+        )
+    except TimeoutError:
+        print("⚠️ manager pagination not found")
+
+
+async def open_page(ctx, mode):
+    page = await ctx.new_page()
+    page.on("response", pacer.on_response)
+    collector = ListApiCollector(page) if mode == "network" else None
+    await page.goto(scraper.DASHBOARD_URL)
+    await wait_for_dashboard(page)
+    return page, collector
+
+
+async def goto_manager_page(page, collector, current, target):
+    if target < current:
+        if collector:
+            collector.clear("manager")
+        await page.goto(scraper.DASHBOARD_URL)
+        await wait_for_dashboard(page)
+        current = 1
+
+    while current < target:
+        if not await goto_next_manager_page(page, collector):
+            break
+        current += 1
+    return current
+
+
+# ---------------- MAIN SCRAPER ----------------
+
+
+async def _page_worker(worker_id, ctx, queue, mode, sink):
+    page, collector = await open_page(ctx, mode)
+    current = 1
+
+    while True:
+        n = queue.claim()
+        if n is None:
+            break
+
+        try:
+            current = await goto_manager_page(page, collector, current, n)
+            if current < n:
+                queue.mark_last(current)
+                continue
+
+            print(f"\n📄 [tab {worker_id}] Manager page {n}")
+            await scrape_manager_page(page, collector, sink)
+        except Exception as e:
+            if sink.consumer.done() and sink.consumer.exception():
+                raise
+            print(f"❌ [tab {worker_id}] Manager page {n} failed: {e}")
+            queue.fail(n)
+            await page.close()
+            page, collector = await open_page(ctx, mode)
+            current = 1
+
+    await page.close()
+
+
+async def scrape_dashboard_async(on_manager=None, mode=None, concurrency=None):
+    """
+    Async engine with the same output contract as scraper.scrape_dashboard().
+    Manager pages are spread over `concurrency` tabs of one browser context;
+    on_manager may be sync or async and runs alongside the browser work.
+    """
+    print("🟢 ASYNC SCRAPER STARTED")
+
+    mode = mode or scraper.SCRAPE_MODE
+    concurrency = concurrency or CONCURRENCY
+    queue = ManagerPageQueue()
+    identities = None
+    if scraper.IDENTITY_CACHE_FILE:
+        identities = IdentityCache(scraper.IDENTITY_CACHE_FILE)
+    sink = ManagerSink(on_manager, identities=identities)
+
+    async with async_playwright() as p:
+        profile = scraper.LAUNCH_PROFILES[scraper.LAUNCH_PROFILE]
+        browser = await p.chromium.launch(headless=True, args=profile["args"])
+        ctx = await browser.new_context(
+            storage_state=scraper.STATE_FILE,
+            viewport=profile["viewport"],
+        )
+        if scraper.BLOCK_RESOURCE_TYPES or scraper.BLOCK_URL_PATTERNS:
+            await ctx.route("**/*", block_heavy_requests)
+
+        try:
+            await asyncio.gather(
+                *(
+                    _page_worker(i + 1, ctx, queue, mode, sink)
+                    for i in range(concurrency)
+                )
+            )
+        finally:
+            await sink.close()
+            await browser.close()
+            if identities:
+                identities.save()
+
+    if queue.failed_pages:
+        print(f"⚠️ Manager pages failed after retries: {sorted(queue.failed_pages)}")
+
+    print(f"\n✅ DONE. Total managers: {len(sink.final_data)}")
+    return sink.final_data
+
+
+def run_async_scraper(on_manager=None, mode=None, concurrency=None):
+    return asyncio.run(scrape_dashboard_async(on_manager, mode, concurrency))
+
+
+if __name__ == "__main__":
+    run_async_scraper()
@@ -1,7 +1,15 @@
 import sys
 import os
 import re
-from django.db import transaction
+import json
+import hashlib
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -14,61 +22,159 @@ import django
 
 django.setup()
 
-from accounts.models import User
+from accounts.models import ONBOARDING_PASSWORD, User
 from managers.models import Manager
-from creators.models import Creator
+from creators.models import Creator, CreatorDailySnapshot
+from creators.snapshots import milestone_bits
 from api.models import ReportingMonth
 from scripts.scraper import scrape_dashboard
 
+# save a manager's creators with a few set-based queries + one upsert
+# (False = the old row-by-row path, 10 creators per transaction)
+BULK_SAVE = True
+# password of new scraped users: "deferred" stores a marker that is hashed
+# at the user's first login (no PBKDF2 per user in the loader), "hashed"
+# hashes ONBOARDING_PASSWORD now, spread over PASSWORD_HASH_WORKERS processes
+ONBOARDING_PASSWORDS = "deferred"
+PASSWORD_HASH_WORKERS = os.cpu_count() or 1
+# upsert today's CreatorDailySnapshot of every creator row written while
+# loading the current month (creators/snapshots.py reads them)
+DAILY_SNAPSHOTS = True
+# managers waiting for the DB writer; a full queue blocks the scraper
+WRITER_QUEUE_SIZE = 16
+# managers the scraper delivered but the writer never saved (JSONL)
+UNSAVED_MANAGERS_FILE = os.path.join(BASE_DIR, "scripts", "unsaved_managers.jsonl")
+
 
 # ------------------ Helpers ------------------
-def safe_int(val):
+# cells the portal leaves blank / dashes; they parse to the default silently
+EMPTY_CELLS = ("", "-", "—")
+MONEY_RE = re.compile(r"([\d,]+\.?\d*)")
+DIGITS_COMMAS_RE = re.compile(r"([\d,]+)")
+DIGITS_RE = re.compile(r"(\d+)")
+NOT_FLOAT_RE = re.compile(r"[^\d.]+")
+
+
+# strict parsers: raise ValueError on a cell they can't read
+def to_int(value):
+    return int(float(str(value).replace(",", "").strip()))
+
+
+def to_money(value):
+    m = MONEY_RE.search(str(value))
+    if not m:
+        raise ValueError(f"no amount in {value!r}")
+    return float(m.group(1).replace(",", ""))
+
+
+def to_diamonds(value):
+    m = DIGITS_COMMAS_RE.search(str(value))
+    if not m:
+        raise ValueError(f"no number in {value!r}")
+    return int(m.group(1).replace(",", ""))
+
+
+def to_milestones(value):
+    if "No" in value:
+        return []
+    return [v.strip() for v in value.split("\n") if v.strip()]
+
+
+def to_float(value):
+    return float(NOT_FLOAT_RE.sub("", str(value)))
+
+
+def to_days(value):
+    m = DIGITS_RE.search(str(value))
+    if not m:
+        raise ValueError(f"no number in {value!r}")
+    return int(m.group(1))
+
+
+def _lenient(parse, value, default):
+    if value is None or str(value).strip() in EMPTY_CELLS:
+        return default
     try:
-        if val is None:
-            return 0
-        val = str(val).replace(",", "").strip()
-        if not val or val in ["-", "—"]:
-            return 0
-        return int(float(val))
-    except:
-        return 0
+        return parse(value)
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+# lenient parsers: one cell, default on blank / unreadable input
+def safe_int(val):
+    return _lenient(to_int, val, 0)
 
 
 def parse_money(value):
-    if not value:
-        return 0.0
-    m = re.search(r"([\d,]+\.?\d*)", value)
-    return float(m.group(1).replace(",", "")) if m else 0.0
+    return _lenient(to_money, value, 0.0)
 
 
 def parse_diamonds(value):
-    if not value:
-        return 0
-    m = re.search(r"([\d,]+)", value)
-    return int(m.group(1).replace(",", "")) if m else 0
+    return _lenient(to_diamonds, value, 0)
 
 
 def parse_milestones(value):
-    if not value or "No" in value:
-        return []
-    return [v.strip() for v in value.split("\n") if v.strip()]
+    return _lenient(to_milestones, value, None) or []
 
 
 def parse_float(value):
-    if not value:
-        return 0.0
-    value = re.sub(r"[^\d.]+", "", str(value))
-    try:
-        return float(value)
-    except:
-        return 0.0
+    return _lenient(to_float, value, 0.0)
 
 
 def parse_days(value):
-    if not value:
-        return 0
-    m = re.search(r"(\d+)", str(value))
-    return int(m.group(1)) if m else 0
+    return _lenient(to_days, value, 0)
+
+
+# Creator model field -> (scraped column, strict parser, default)
+CREATOR_METRIC_FIELDS = {
+    "estimated_bonus_contribution": ("Estimated bonus contribution", to_money, 0.0),
+    "achieved_milestones": ("Achieved milestones", to_milestones, list),
+    "diamonds": ("Diamonds", to_diamonds, 0),
+    "valid_go_live_days": ("Valid go LIVE days", to_days, 0),
+    "live_duration": ("LIVE duration", to_float, 0.0),
+}
+
+
+def parse_metric_columns(rows, fields=CREATOR_METRIC_FIELDS):
+    """
+    Parse a whole batch of scraped rows column by column.
+    Returns ({field: [value per row]}, {field: [(row index, raw cell)]});
+    unreadable cells get the field's default and land in the error report,
+    blank ones just get the default.
+    """
+    columns = {}
+    errors = {}
+    for field, (column, parse, default) in fields.items():
+        values = []
+        bad = []
+        for i, row in enumerate(rows):
+            raw = row.get(column)
+            if raw is None or str(raw).strip() in EMPTY_CELLS:
+                values.append(default() if callable(default) else default)
+                continue
+            try:
+                values.append(parse(raw))
+            except (TypeError, ValueError, OverflowError):
+                values.append(default() if callable(default) else default)
+                bad.append((i, raw))
+        columns[field] = values
+        if bad:
+            errors[field] = bad
+    return columns, errors
+
+
+def row_digest(fields):
+    """sha1 of the values a loader row writes (model instances by pk)."""
+    raw = json.dumps(
+        fields, sort_keys=True, ensure_ascii=False, default=lambda obj: obj.pk
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def report_parse_errors(errors, label):
+    for field, bad in errors.items():
+        samples = ", ".join(repr(raw) for _, raw in bad[:3])
+        print(f"⚠️ {label}: {len(bad)} unreadable {field} cells (e.g. {samples})")
 
 
 def get_reporting_month(code):
@@ -77,6 +183,24 @@ def get_reporting_month(code):
 
 
 # ------------------ User Management ------------------
+def free_username(base, exclude_pk=None):
+    """
+    `base` if no other user has it, else the first free base_1, base_2, ...
+    One query: every existing base / base_N username is fetched at once.
+    """
+    taken = set(
+        User.objects.filter(Q(username=base) | Q(username__startswith=f"{base}_"))
+        .exclude(pk=exclude_pk)
+        .values_list("username", flat=True)
+    )
+    if base not in taken:
+        return base
+    n = 1
+    while f"{base}_{n}" in taken:
+        n += 1
+    return f"{base}_{n}"
+
+
 def get_or_create_user_by_uid_or_username(
     *, uid=None, username=None, role=None, name=None, email=None
 ):
@@ -99,20 +223,8 @@ def get_or_create_user_by_uid_or_username(
     if user:
         updated = False
         if username and user.username != username:
-            if not User.objects.filter(username=username).exclude(pk=user.pk).exists():
-                user.username = username
-                updated = True
-            else:
-                base = username
-                counter = 1
-                while (
-                    User.objects.filter(username=f"{base}_{counter}")
-                    .exclude(pk=user.pk)
-                    .exists()
-                ):
-                    counter += 1
-                user.username = f"{base}_{counter}"
-                updated = True
+            user.username = free_username(username, exclude_pk=user.pk)
+            updated = True
         if uid and not user.uid:
             user.uid = uid
             updated = True
@@ -138,15 +250,8 @@ def get_or_create_user_by_uid_or_username(
         return user, False
 
     # Create new user
-    original_username = username or f"unknown_{uid}"
-    unique_username = original_username
-    counter = 1
-    while User.objects.filter(username=unique_username).exists():
-        unique_username = f"{original_username}_{counter}"
-        counter += 1
-
-    user = User.objects.create(
-        username=unique_username,
+    user = User(
+        username=free_username(username or f"unknown_{uid}"),
         uid=uid,
         role=role,
         name=name,
@@ -155,11 +260,212 @@ def get_or_create_user_by_uid_or_username(
         ),
         email_verified=bool(email),
     )
-    user.set_password("1234")
+    set_onboarding_password(user)
     user.save()
     return user, True
 
 
+# ------------------ Onboarding Passwords ------------------
+_hash_pool = None
+
+
+def set_onboarding_password(user):
+    if ONBOARDING_PASSWORDS == "deferred":
+        user.set_deferred_password()  # hashed at the user's first login
+    else:
+        user.set_password(ONBOARDING_PASSWORD)
+
+
+def _hash_onboarding_password(_):
+    return make_password(ONBOARDING_PASSWORD)
+
+
+def hash_onboarding_passwords(users):
+    """set_password(ONBOARDING_PASSWORD) for many users, in a process pool."""
+    global _hash_pool
+    if len(users) < 2 or PASSWORD_HASH_WORKERS < 2:
+        for user in users:
+            user.set_password(ONBOARDING_PASSWORD)
+        return
+
+    if _hash_pool is None:
+        # spawn: the loader runs scraper / writer threads, forking them is unsafe
+        _hash_pool = ProcessPoolExecutor(
+            PASSWORD_HASH_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    chunksize = max(1, len(users) // (PASSWORD_HASH_WORKERS * 4))
+    hashes = _hash_pool.map(
+        _hash_onboarding_password, range(len(users)), chunksize=chunksize
+    )
+    for user, encoded in zip(users, hashes):
+        user.password = encoded
+
+
+class IdentityIndex:
+    """
+    uid -> user, username -> user and the taken emails of one load run, so
+    the bulk path resolves identities with dictionary lookups.
+
+    resolve() follows the rules of get_or_create_user_by_uid_or_username()
+    and keeps new / changed users in memory until flush() writes them in
+    one bulk_create + one bulk_update. `complete=True` loads every user up
+    front (one index per ManagerWriter run); otherwise prefetch() loads the
+    rows a batch asks for and unknown usernames are checked in the DB.
+    """
+
+    def __init__(self, complete=False):
+        self.complete = complete
+        self.reload()
+
+    def reload(self):
+        """Forget everything (e.g. after a rolled back flush) and start over."""
+        self.by_uid = {}
+        self.by_username = {}
+        self.emails = set()
+        self.known_usernames = set()  # looked up in the DB (found or not)
+        self.suffixes_loaded = set()  # bases whose base_N users are loaded
+        self.next_suffix = {}  # base -> first base_N suffix worth trying
+        self.new = []
+        self.changed = {}  # pk -> user
+        if self.complete:
+            self._add(User.objects.all())
+            print(f"🗂️ Identity index: {len(self.by_username)} users")
+
+    def _add(self, users):
+        for user in users:
+            current = self.by_uid.get(user.uid) if user.uid else None
+            # the lowest pk wins for a uid, like .filter(uid=...).first()
+            if user.uid and (current is None or (current.pk and current.pk > user.pk)):
+                self.by_uid[user.uid] = user
+            self.by_username.setdefault(user.username, user)
+            self.known_usernames.add(user.username)
+            if user.email:
+                self.emails.add(user.email)
+
+    def prefetch(self, entries):
+        """Load the users a batch of resolve() entries can match."""
+        if self.complete:
+            return
+        uids = {e["uid"] for e in entries if e["uid"]} - set(self.by_uid)
+        usernames = {e["username"] for e in entries if e["username"]}
+        usernames -= self.known_usernames
+        emails = {e["email"] for e in entries if e["email"]} - self.emails
+
+        self._add(User.objects.filter(Q(uid__in=uids) | Q(username__in=usernames)))
+        self.known_usernames |= usernames
+        self.emails.update(
+            User.objects.filter(email__in=emails).values_list("email", flat=True)
+        )
+
+    def username_taken(self, username, exclude=None):
+        owner = self.by_username.get(username)
+        if owner is not None:
+            return owner is not exclude
+        if self.complete or username in self.known_usernames:
+            return False
+        return (
+            User.objects.filter(username=username)
+            .exclude(pk=getattr(exclude, "pk", None))
+            .exists()
+        )
+
+    def _load_suffixes(self, base):
+        """One prefix query for every existing base_N (partial index only)."""
+        if self.complete or base in self.suffixes_loaded:
+            return
+        self.suffixes_loaded.add(base)
+        self._add(User.objects.filter(username__startswith=f"{base}_"))
+
+    def unique_username(self, base, exclude=None):
+        if not self.username_taken(base, exclude):
+            return base
+        self._load_suffixes(base)
+        # per-base counter: every suffix below it is known to be taken
+        n = self.next_suffix.get(base, 1)
+        while self.by_username.get(f"{base}_{n}") not in (None, exclude):
+            n += 1
+        self.next_suffix[base] = n + 1
+        return f"{base}_{n}"
+
+    def resolve(self, *, uid=None, username=None, role=None, name=None, email=None):
+        """The user for this identity, created / updated in memory (or None)."""
+        if not uid and not username:
+            print(f"❌ Skipping user because UID and username are missing")
+            return None
+
+        user = (self.by_uid.get(uid) if uid else None) or (
+            self.by_username.get(username) if username else None
+        )
+        if user:
+            updated = False
+            if username and user.username != username:
+                self.by_username.pop(user.username, None)
+                user.username = self.unique_username(username, exclude=user)
+                self.by_username[user.username] = user
+                updated = True
+            if uid and not user.uid:
+                user.uid = uid
+                self.by_uid.setdefault(uid, user)
+                updated = True
+            if role and user.role != role:
+                user.role = role
+                updated = True
+            if name and not user.name:
+                user.name = name
+                updated = True
+            if email and not user.email and email not in self.emails:
+                user.email = email
+                user.email_verified = True
+                self.emails.add(email)
+                updated = True
+            if updated and user.pk:
+                self.changed[user.pk] = user
+            return user
+
+        user = User(
+            username=self.unique_username(username or f"unknown_{uid}"),
+            uid=uid,
+            role=role,
+            name=name,
+            email=email if email and email not in self.emails else None,
+            email_verified=bool(email),
+        )
+        if ONBOARDING_PASSWORDS == "deferred":
+            user.set_deferred_password()
+        if user.email:
+            self.emails.add(user.email)
+        self.by_username[user.username] = user
+        if uid:
+            self.by_uid[uid] = user
+        self.new.append(user)
+        return user
+
+    def flush(self):
+        """Write the users resolve() created or changed since the last flush."""
+        if self.changed:
+            now = timezone.now()
+            for user in self.changed.values():
+                user.updated_at = now
+            User.objects.bulk_update(
+                list(self.changed.values()),
+                [
+                    "username",
+                    "uid",
+                    "role",
+                    "name",
+                    "email",
+                    "email_verified",
+                    "updated_at",
+                ],
+            )
+        if self.new:
+            if ONBOARDING_PASSWORDS != "deferred":
+                hash_onboarding_passwords(self.new)
+            User.objects.bulk_create(self.new)
+        self.changed = {}
+        self.new = []
+
+
 def extract_manager_identity(creators):
     manager_uid = None
     manager_email = None
@@ -174,11 +480,30 @@ def extract_manager_identity(creators):
 
 
 # ------------------ Main Save Function ------------------
-def save_manager_chunk(manager_data, month_code, chunk_size=10):
+def save_manager_chunk(
+    manager_data,
+    month_code,
+    chunk_size=10,
+    bulk=None,
+    identities=None,
+    prepared=None,
+):
+    """
+    `identities` is the IdentityIndex of the load run for the bulk path
+    (a per-call index that only loads this manager's users otherwise),
+    `prepared` its prepare_manager() result when that already ran elsewhere.
+    """
     report_month = get_reporting_month(month_code)
     manager_name = manager_data.get("Creator Network manager")
     print(f"\n Manager incoming: {manager_name}")
 
+    if bulk is None:
+        bulk = BULK_SAVE
+    if bulk:
+        return save_manager_bulk(
+            manager_data, report_month, identities or IdentityIndex(), prepared
+        )
+
     creators = manager_data.get("creators", [])
     manager_uid, manager_email = extract_manager_identity(creators)
 
@@ -191,27 +516,12 @@ def save_manager_chunk(manager_data, month_code, chunk_size=10):
         email=manager_email,
     )
 
-    # Save Manager record
-    manager, created = Manager.objects.update_or_create(
-        user=user_m,
-        report_month=report_month,
-        defaults={
-            "manager_uid": manager_uid,
-            "eligible_creators": safe_int(manager_data.get("Eligible creators")),
-            "estimated_bonus_contribution": parse_money(
-                manager_data.get("Estimated bonus contribution")
-            ),
-            "diamonds": parse_diamonds(manager_data.get("Diamonds")),
-            "M_0_5": safe_int(manager_data.get("M0.5")),
-            "M1": safe_int(manager_data.get("M1")),
-            "M2": safe_int(manager_data.get("M2")),
-            "M1R": safe_int(manager_data.get("M1R")),
-        },
-    )
+    manager = save_manager_record(manager_data, user_m, manager_uid, report_month)
 
     # Process creators in chunks
     for i in range(0, len(creators), chunk_size):
         chunk = creators[i : i + chunk_size]
+        saved = []
         with transaction.atomic():
             for c in chunk:
                 creator_name = c.get("Creator")
@@ -232,28 +542,336 @@ def save_manager_chunk(manager_data, month_code, chunk_size=10):
                     print(f"❌ Skipping creator {creator_name} because UID is missing")
                     continue
 
-                Creator.objects.update_or_create(
+                fields = {
+                    "user": user_c,
+                    "manager": manager,
+                    "group_name": c.get("GroupName"),
+                    "estimated_bonus_contribution": parse_money(
+                        c.get("Estimated bonus contribution")
+                    ),
+                    "achieved_milestones": parse_milestones(
+                        c.get("Achieved milestones")
+                    ),
+                    "diamonds": parse_diamonds(c.get("Diamonds")),
+                    "valid_go_live_days": parse_days(c.get("Valid go LIVE days")),
+                    "live_duration": parse_float(c.get("LIVE duration")),
+                }
+                creator, _ = Creator.objects.update_or_create(
                     creator_uid=creator_uid,
                     report_month=report_month,
-                    defaults={
-                        "user": user_c,
-                        "manager": manager,
-                        "group_name": c.get("GroupName"),
-                        "estimated_bonus_contribution": parse_money(
-                            c.get("Estimated bonus contribution")
-                        ),
-                        "achieved_milestones": parse_milestones(
-                            c.get("Achieved milestones")
-                        ),
-                        "diamonds": parse_diamonds(c.get("Diamonds")),
-                        "valid_go_live_days": parse_days(c.get("Valid go LIVE days")),
-                        "live_duration": parse_float(c.get("LIVE duration")),
-                    },
+                    defaults={**fields, "metrics_digest": row_digest(fields)},
                 )
+                saved.append(creator)
+            save_daily_snapshots(saved, report_month)
 
         print(f"✅ Saved creators {i+1} → {i+len(chunk)} for {manager_name}")
 
 
+def save_manager_record(manager_data, user_m, manager_uid, report_month):
+    """The Manager row of this month, only written when its values changed."""
+    fields = {
+        "manager_uid": manager_uid,
+        "eligible_creators": safe_int(manager_data.get("Eligible creators")),
+        "estimated_bonus_contribution": parse_money(
+            manager_data.get("Estimated bonus contribution")
+        ),
+        "diamonds": parse_diamonds(manager_data.get("Diamonds")),
+        "M_0_5": safe_int(manager_data.get("M0.5")),
+        "M1": safe_int(manager_data.get("M1")),
+        "M2": safe_int(manager_data.get("M2")),
+        "M1R": safe_int(manager_data.get("M1R")),
+    }
+    digest = row_digest(fields)
+    manager = Manager.objects.filter(user=user_m, report_month=report_month).first()
+    if manager and manager.metrics_digest == digest:
+        print(f"⏭️ Manager {user_m.username} unchanged")
+        return manager
+
+    manager, _ = Manager.objects.update_or_create(
+        user=user_m,
+        report_month=report_month,
+        defaults={**fields, "metrics_digest": digest},
+    )
+    return manager
+
+
+def bulk_creators(manager_data):
+    return [c for c in manager_data.get("creators", []) if c.get("Creator")]
+
+
+def prepare_manager(manager_data):
+    """
+    The DB-free half of save_manager_bulk(): the identity entries to
+    resolve and the parsed metric columns of bulk_creators(). Plain data,
+    so an ingest can run it in worker processes.
+    """
+    manager_name = manager_data.get("Creator Network manager")
+    creators = bulk_creators(manager_data)
+    manager_uid, manager_email = extract_manager_identity(creators)
+    return {
+        "manager_entry": {
+            "uid": manager_uid,
+            "username": manager_name,
+            "name": manager_name,
+            "email": manager_email,
+        },
+        "entries": [
+            {
+                "uid": c.get("CreatorID"),
+                "username": c.get("Creator"),
+                "name": c.get("CreatorName"),
+                "email": c.get("CreatorEmail"),
+            }
+            for c in creators
+        ],
+        "parsed": parse_metric_columns(creators),
+    }
+
+
+def save_manager_bulk(manager_data, report_month, identities, prepared=None):
+    """
+    One manager and all its creators in one transaction: the users are
+    resolved through `identities` and written with one flush, the Creator
+    rows with one bulk upsert on (creator_uid, report_month).
+    Returns the row report of save_creator_rows().
+    """
+    if prepared is None:
+        prepared = prepare_manager(manager_data)
+    manager_entry = prepared["manager_entry"]
+    entries = prepared["entries"]
+
+    try:
+        with transaction.atomic():
+            identities.prefetch([manager_entry] + entries)
+            user_m = identities.resolve(role="MANAGER", **manager_entry)
+            users = [identities.resolve(role="CREATOR", **e) for e in entries]
+            identities.flush()
+
+            manager = save_manager_record(
+                manager_data, user_m, manager_entry["uid"], report_month
+            )
+            return save_creator_rows(
+                bulk_creators(manager_data),
+                users,
+                manager,
+                report_month,
+                parsed=prepared["parsed"],
+            )
+    except Exception:
+        # the index may hold users of the rolled back transaction
+        identities.reload()
+        raise
+
+
+def save_creator_rows(creators, users, manager, report_month, parsed=None):
+    """
+    Upsert the Creator rows whose digest differs from the stored one.
+    `parsed` is parse_metric_columns(creators) when already done.
+    Returns {"inserted", "updated", "unchanged", "errors" (parse report)}.
+    """
+    columns, errors = parsed or parse_metric_columns(creators)
+    report_parse_errors(errors, manager.user.username)
+
+    rows = {}  # creator_uid -> Creator, the last row of a uid wins
+    for i, (c, user_c) in enumerate(zip(creators, users)):
+        if not user_c:
+            print(f"❌ Skipping creator {c.get('Creator')} because UID is missing")
+            continue
+        fields = {
+            "user": user_c,
+            "manager": manager,
+            "group_name": c.get("GroupName"),
+            **{field: values[i] for field, values in columns.items()},
+        }
+        rows[c.get("CreatorID")] = Creator(
+            report_month=report_month,
+            creator_uid=c.get("CreatorID"),
+            metrics_digest=row_digest(fields),
+            **fields,
+        )
+
+    stored = dict(
+        Creator.objects.filter(
+            report_month=report_month, creator_uid__in=list(rows)
+        ).values_list("creator_uid", "metrics_digest")
+    )
+    report = {"inserted": 0, "updated": 0, "unchanged": 0, "errors": errors}
+    changed = []
+    for creator_uid, row in rows.items():
+        if creator_uid not in stored:
+            report["inserted"] += 1
+        elif stored[creator_uid] != row.metrics_digest:
+            report["updated"] += 1
+        else:
+            report["unchanged"] += 1
+            continue
+        changed.append(row)
+
+    Creator.objects.bulk_create(
+        changed,
+        update_conflicts=True,
+        unique_fields=["creator_uid", "report_month"],
+        update_fields=[
+            "user",
+            "manager",
+            "group_name",
+            "estimated_bonus_contribution",
+            "achieved_milestones",
+            "diamonds",
+            "valid_go_live_days",
+            "live_duration",
+            "metrics_digest",
+            "updated_at",
+        ],
+    )
+
+    save_daily_snapshots(changed, report_month)
+
+    print(
+        f"✅ Creators of {manager.user.username}: {report['inserted']} inserted, "
+        f"{report['updated']} updated, {report['unchanged']} unchanged"
+    )
+    return report
+
+
+def save_daily_snapshots(rows, report_month):
+    """
+    Upsert today's snapshot of the given Creator rows with one query.
+    Only for the current month: a backfilled month has no "today".
+    Creators that did not change today get no row, the query side carries
+    their last snapshot forward.
+    """
+    today = timezone.localdate()
+    if not DAILY_SNAPSHOTS or not rows or report_month.code != today.strftime("%Y%m"):
+        return
+    CreatorDailySnapshot.objects.bulk_create(
+        [
+            CreatorDailySnapshot(
+                creator_uid=row.creator_uid,
+                day=today,
+                manager_user_id=row.manager.user_id,
+                diamonds=row.diamonds,
+                live_duration=row.live_duration,
+                valid_go_live_days=row.valid_go_live_days,
+                bonus=row.estimated_bonus_contribution,
+                milestones=milestone_bits(row.achieved_milestones),
+            )
+            for row in rows
+        ],
+        update_conflicts=True,
+        unique_fields=["creator_uid", "day"],
+        update_fields=[
+            "manager_user",
+            "diamonds",
+            "live_duration",
+            "valid_go_live_days",
+            "bonus",
+            "milestones",
+        ],
+    )
+
+
+# ------------------ Pipelined Writer ------------------
+class ManagerWriter:
+    """
+    on_manager callback that hands managers to a writer thread, so the
+    browser keeps scraping while save_manager_chunk runs.
+
+    The queue is bounded (backpressure), close() waits until everything
+    queued is saved, and a failed save is raised in the scraper thread on
+    the next delivery or at close(). Managers that were delivered but not
+    saved are appended to UNSAVED_MANAGERS_FILE.
+    """
+
+    _STOP = object()
+
+    def __init__(self, month_code, maxsize=WRITER_QUEUE_SIZE):
+        self.month_code = month_code
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.error = None
+        self.saved = 0
+        self.creator_rows = {"inserted": 0, "updated": 0, "unchanged": 0}
+        self.unsaved = []
+        self.thread = threading.Thread(
+            target=self._drain, name="manager-writer", daemon=True
+        )
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # an error already on its way out is not raised a second time
+        self.close(raise_error=exc_type is None)
+        return False
+
+    def __call__(self, manager_data):
+        self._put(manager_data)
+
+    def _raise_error(self):
+        raise RuntimeError(f"DB writer failed: {self.error}") from self.error
+
+    def _put(self, item):
+        if self.error is not None and item is not self._STOP:
+            self.unsaved.append(item)
+            self._raise_error()
+        # blocks while the queue is full; the writer keeps draining even
+        # after a failure, so this never deadlocks
+        self.queue.put(item)
+
+    def _drain(self):
+        identities = None
+        try:
+            while True:
+                manager_data = self.queue.get()
+                if manager_data is self._STOP:
+                    break
+                if self.error is not None:
+                    self.unsaved.append(manager_data)
+                    continue
+                try:
+                    if identities is None and BULK_SAVE:
+                        # loaded on the writer thread, once per run
+                        identities = IdentityIndex(complete=True)
+                    report = save_manager_chunk(
+                        manager_data, self.month_code, identities=identities
+                    )
+                    self.saved += 1
+                    for key in self.creator_rows:
+                        self.creator_rows[key] += report[key] if report else 0
+                except Exception as e:
+                    manager_name = manager_data.get("Creator Network manager")
+                    print(f"❌ DB writer failed on {manager_name}: {e}")
+                    self.error = e
+                    self.unsaved.append(manager_data)
+        finally:
+            connection.close()
+
+    def close(self, raise_error=True):
+        """Wait for the queue to drain; re-raise a writer error."""
+        if self.thread.is_alive():
+            self._put(self._STOP)
+            self.thread.join()
+        rows = self.creator_rows
+        print(
+            f"💾 DB writer saved {self.saved} managers "
+            f"(creators: {rows['inserted']} inserted, {rows['updated']} updated, "
+            f"{rows['unchanged']} unchanged)"
+        )
+
+        if self.unsaved:
+            self._dump_unsaved()
+        if self.error is not None and raise_error:
+            self._raise_error()
+
+    def _dump_unsaved(self):
+        with open(UNSAVED_MANAGERS_FILE, "a", encoding="utf-8") as f:
+            for manager_data in self.unsaved:
+                f.write(json.dumps(manager_data, ensure_ascii=False) + "\n")
+        print(f"⚠️ {len(self.unsaved)} unsaved managers → {UNSAVED_MANAGERS_FILE}")
+        self.unsaved = []
+
+
 # ------------------ Run Script ------------------
 if __name__ == "__main__":
     print("🚀 load_data.py started")
@@ -262,8 +880,13 @@ if __name__ == "__main__":
     # current_month = "202601"
 
     def on_manager_scraped(manager_data):
-        save_manager_chunk(manager_data, current_month)
-
-    scrape_dashboard(on_manager=on_manager_scraped)
+        save_manager_chunk(manager_data, current_month, identities=identities)
+
+    if "--sync-writes" in sys.argv:
+        identities = IdentityIndex(complete=True) if BULK_SAVE else None
+        scrape_dashboard(on_manager=on_manager_scraped, resume="--resume" in sys.argv)
+    else:
+        with ManagerWriter(current_month) as writer:
+            scrape_dashboard(on_manager=writer, resume="--resume" in sys.argv)
 
     print("🏁 DONE")
@@ -0,0 +1,528 @@
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+# Offline stand-in for the Backstage revenue task page, with the DOM and the
+# XHRs scraper.py relies on (semi-table rows with aria-rowindex/colindex,
+# the creator sidesheet with its own pagination, avatar hover ->
+# anchor_profile, task/manager_list + task/anchor_list JSON).
+#
+#   python scripts/mock_backstage.py serve --managers 50
+#   python scripts/mock_backstage.py bench --managers 20 --creators 30
+
+API_PREFIX = "/api/v1/revenue"
+PORTAL_PATH = "/portal/revenue/task"
+
+MOCK_MANAGERS = 20
+MOCK_MAX_CREATORS = 30  # per manager, the actual count is random
+MOCK_PAGE_SIZE = 10
+MOCK_SHEET_PAGE_SIZE = 10
+MOCK_LATENCY = 0.2  # seconds per list XHR
+MOCK_PROFILE_LATENCY = 0.1  # seconds per anchor_profile XHR
+MOCK_JITTER = 0.5  # +/- share of the latency
+MOCK_ERROR_RATE = 0.0  # share of anchor_profile XHRs answered with a 500
+MOCK_SEED = 7
+
+MILESTONES = ("M0.5", "M1", "M1R", "M2")
+
+
+class MockPortal:
+    """Deterministic synthetic managers / creators served by the mock."""
+
+    def __init__(
+        self,
+        managers=MOCK_MANAGERS,
+        max_creators=MOCK_MAX_CREATORS,
+        page_size=MOCK_PAGE_SIZE,
+        sheet_page_size=MOCK_SHEET_PAGE_SIZE,
+        latency=MOCK_LATENCY,
+        profile_latency=MOCK_PROFILE_LATENCY,
+        jitter=MOCK_JITTER,
+        error_rate=MOCK_ERROR_RATE,
+        seed=MOCK_SEED,
+    ):
+        self.managers = managers
+        self.max_creators = max_creators
+        self.page_size = page_size
+        self.sheet_page_size = sheet_page_size
+        self.latency = latency
+        self.profile_latency = profile_latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    @lru_cache(maxsize=None)
+    def manager(self, index):
+        rng = random.Random(f"{self.seed}-m{index}")
+        count = rng.randint(0, self.max_creators)
+        return {
+            "ManagerID": str(7100000000 + index),
+            "ManagerName": f"mock_manager_{index:04d}",
+            "AgentEmail": f"manager{index}@mock.example",
+            "EligibleAnchorCount": str(count),
+            "EstimatedBonus": f"${rng.uniform(0, 5000):,.2f}",
+            "Diamonds": f"{rng.randint(0, 2_000_000):,}",
+            "M05": str(rng.randint(0, count)),
+            "M1": str(rng.randint(0, count)),
+            "M2": str(rng.randint(0, count)),
+            "M1R": str(rng.randint(0, count)),
+        }
+
+    @lru_cache(maxsize=None)
+    def creators(self, index):
+        manager = self.manager(index)
+        rng = random.Random(f"{self.seed}-c{index}")
+        creators = []
+        for n in range(int(manager["EligibleAnchorCount"])):
+            achieved = [m for m in MILESTONES if rng.random() < 0.3]
+            creator = {
+                "CreatorID": str(6900000000000 + index * 10000 + n),
+                "user_id": str(8800000000 + index * 10000 + n),
+                "display_id": f"mock_creator_{index:04d}_{n:03d}",
+                "nickname": f"Mock Creator {index}.{n}",
+                "GroupName": f"Group {rng.randint(1, 5)}",
+                "EstimatedBonus": f"${rng.uniform(0, 300):,.2f}",
+                "AchievedMilestones": "\n".join(achieved) or "No milestones",
+                "Diamonds": f"{rng.randint(0, 200_000):,}",
+                "ValidLiveDays": f"{rng.randint(0, 31)} days",
+                "LiveDuration": f"{rng.uniform(0, 120):.1f}h",
+            }
+            creators.append(creator)
+        return creators
+
+    def expected(self):
+        """(managers, creators) a complete scrape has to deliver."""
+        creators = sum(len(self.creators(i)) for i in range(self.managers))
+        return self.managers, creators
+
+    def sleep(self, latency):
+        if latency > 0:
+            time.sleep(latency * (1 + self.rng.uniform(-self.jitter, self.jitter)))
+
+    def manager_list(self, page, size=None):
+        size = size or self.page_size
+        start = (page - 1) * size
+        indexes = range(start, min(start + size, self.managers))
+        return {
+            "code": 0,
+            "data": {
+                "list": [self.manager(i) for i in indexes],
+                "total": self.managers,
+                "page": page,
+            },
+        }
+
+    def anchor_list(self, manager_id, page, size=None):
+        size = size or self.sheet_page_size
+        index = int(manager_id) - 7100000000
+        creators = self.creators(index) if 0 <= index < self.managers else []
+        start = (page - 1) * size
+        rows = [
+            # the list rows carry no CreatorID, same as the portal
+            {k: v for k, v in c.items() if k not in ("CreatorID", "user_id")}
+            for c in creators[start : start + size]
+        ]
+        return {
+            "code": 0,
+            "data": {"list": rows, "total": len(creators), "page": page},
+        }
+
+    def anchor_profile(self, display_id):
+        # the avatar only knows the handle: mock_creator_<manager>_<n>
+        try:
+            index = int(display_id.rsplit("_", 2)[1])
+        except (IndexError, ValueError):
+            return None
+        if not 0 <= index < self.managers:
+            return None
+
+        manager = self.manager(index)
+        for creator in self.creators(index):
+            if creator["display_id"] != display_id:
+                continue
+            return {
+                "HostBaseInfo": {
+                    "CreatorID": creator["CreatorID"],
+                    "user_id": creator["user_id"],
+                    "nickname": creator["nickname"],
+                    "display_id": creator["display_id"],
+                    "AgentInfo": {
+                        "AgentID": manager["ManagerID"],
+                        "AgentName": manager["AgentEmail"],
+                        "GroupName": creator["GroupName"],
+                    },
+                }
+            }
+        return None
+
+
+PORTAL_HTML = """<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Mock Backstage</title>
+<style>
+body { font-family: sans-serif; margin: 0; }
+.semi-table { border-collapse: collapse; width: 100%; }
+.semi-table td, .semi-table th { border: 1px solid #ddd; padding: 4px 8px; }
+.semi-page { display: flex; gap: 8px; list-style: none; padding: 0; }
+.semi-page li { cursor: pointer; padding: 2px 8px; border: 1px solid #ccc; }
+.semi-page li[aria-disabled="true"] { opacity: .4; cursor: default; }
+.semi-sidesheet { position: fixed; top: 0; right: 0; bottom: 0; width: 900px;
+  background: #fff; border-left: 1px solid #999; overflow: auto; padding: 8px; }
+.semi-sidesheet [role="row"] { display: flex; border-bottom: 1px solid #eee; }
+.semi-sidesheet [role="cell"] { flex: 1; padding: 4px; white-space: pre-line; }
+.avatarContainer-yJA0K2 { display: inline-block; width: 24px; height: 24px;
+  border-radius: 12px; background: #bbb; margin-right: 6px; vertical-align: middle; }
+</style>
+</head>
+<body>
+<div id="task-v2-page">
+  <table class="semi-table">
+    <thead class="semi-table-thead">
+      <tr role="row" aria-rowindex="0">
+        <th aria-colindex="1">#</th>
+        <th aria-colindex="2">Creator Network manager</th>
+        <th aria-colindex="3">Eligible creators</th>
+        <th aria-colindex="4">Estimated bonus contribution</th>
+        <th aria-colindex="5">Diamonds</th>
+        <th aria-colindex="6">M0.5</th>
+        <th aria-colindex="7">M1</th>
+        <th aria-colindex="8">M2</th>
+        <th aria-colindex="9">M1R</th>
+      </tr>
+    </thead>
+    <tbody class="semi-table-tbody"></tbody>
+  </table>
+  <div id="manager-pagination"></div>
+</div>
+<script>
+const API = "__API__";
+const PAGE_SIZE = __PAGE_SIZE__;
+const SHEET_PAGE_SIZE = __SHEET_PAGE_SIZE__;
+let managerPage = 1;
+let sheet = null;
+
+function pagination(page, total, size, onNext) {
+  const ul = document.createElement("ul");
+  ul.className = "semi-page";
+  const last = page * size >= total;
+  ul.innerHTML =
+    '<li class="semi-page-prev" aria-disabled="' + (page === 1) + '">&lsaquo;</li>' +
+    '<li class="semi-page-item">' + page + '</li>' +
+    '<li class="semi-page-next" aria-disabled="' + last + '">&rsaquo;</li>';
+  ul.querySelector(".semi-page-next").addEventListener("click", () => {
+    if (!last) onNext(page + 1);
+  });
+  return ul;
+}
+
+async function loadManagers(page) {
+  const res = await fetch(API + "/task/manager_list?page=" + page);
+  const body = await res.json();
+  managerPage = page;
+  const tbody = document.querySelector("tbody.semi-table-tbody");
+  tbody.innerHTML = body.data.list.map((m, i) =>
+    '<tr class="semi-table-row" role="row" aria-rowindex="' + ((page - 1) * PAGE_SIZE + i + 1) + '">' +
+    '<td aria-colindex="1">' + ((page - 1) * PAGE_SIZE + i + 1) + '</td>' +
+    '<td aria-colindex="2">' + m.ManagerName + '</td>' +
+    '<td aria-colindex="3"><button data-manager="' + m.ManagerID + '">' + m.EligibleAnchorCount + '</button></td>' +
+    '<td aria-colindex="4">' + m.EstimatedBonus + '</td>' +
+    '<td aria-colindex="5">' + m.Diamonds + '</td>' +
+    '<td aria-colindex="6">' + m.M05 + '</td>' +
+    '<td aria-colindex="7">' + m.M1 + '</td>' +
+    '<td aria-colindex="8">' + m.M2 + '</td>' +
+    '<td aria-colindex="9">' + m.M1R + '</td>' +
+    '</tr>'
+  ).join("");
+  tbody.querySelectorAll("button[data-manager]").forEach((btn) =>
+    btn.addEventListener("click", () => openSheet(btn.dataset.manager))
+  );
+  const holder = document.getElementById("manager-pagination");
+  holder.innerHTML = "";
+  holder.appendChild(pagination(page, body.data.total, PAGE_SIZE, loadManagers));
+}
+
+function closeSheet() {
+  if (sheet) sheet.remove();
+  sheet = null;
+}
+
+function openSheet(managerId) {
+  closeSheet();
+  sheet = document.createElement("div");
+  sheet.className = "semi-sidesheet";
+  sheet.setAttribute("role", "dialog");
+  sheet.innerHTML =
+    '<button class="semi-sidesheet-close" aria-label="Close">&times;</button>' +
+    '<div class="semi-sidesheet-body"><div class="sheet-rows"></div><div class="sheet-pagination"></div></div>';
+  sheet.querySelector(".semi-sidesheet-close").addEventListener("click", closeSheet);
+  document.body.appendChild(sheet);
+  loadCreators(sheet, managerId, 1);
+}
+
+async function loadCreators(owner, managerId, page) {
+  const res = await fetch(API + "/task/anchor_list?manager_id=" + managerId + "&page=" + page);
+  const body = await res.json();
+  if (owner !== sheet) return;  // closed meanwhile
+  const header =
+    '<div role="row" aria-rowindex="0">' +
+    '<div role="cell" aria-colindex="1">Creator</div>' +
+    '<div role="cell" aria-colindex="2">Estimated bonus contribution</div>' +
+    '<div role="cell" aria-colindex="3">Achieved milestones</div>' +
+    '<div role="cell" aria-colindex="4">Diamonds</div>' +
+    '<div role="cell" aria-colindex="5">Valid go LIVE days</div>' +
+    '<div role="cell" aria-colindex="6">LIVE duration</div>' +
+    '</div>';
+  const rows = body.data.list.map((c, i) =>
+    '<div role="row" aria-rowindex="' + ((page - 1) * SHEET_PAGE_SIZE + i + 1) + '">' +
+    '<div role="cell" aria-colindex="1"><span class="avatarContainer-yJA0K2" data-handle="' + c.display_id + '"></span>' + c.display_id + '</div>' +
+    '<div role="cell" aria-colindex="2">' + c.EstimatedBonus + '</div>' +
+    '<div role="cell" aria-colindex="3">' + c.AchievedMilestones + '</div>' +
+    '<div role="cell" aria-colindex="4">' + c.Diamonds + '</div>' +
+    '<div role="cell" aria-colindex="5">' + c.ValidLiveDays + '</div>' +
+    '<div role="cell" aria-colindex="6">' + c.LiveDuration + '</div>' +
+    '</div>'
+  ).join("");
+  owner.querySelector(".sheet-rows").innerHTML = header + rows;
+  owner.querySelectorAll(".avatarContainer-yJA0K2").forEach((avatar) =>
+    avatar.addEventListener("mouseenter", () =>
+      fetch(API + "/anchor_profile?display_id=" + avatar.dataset.handle)
+    )
+  );
+  const holder = owner.querySelector(".sheet-pagination");
+  holder.innerHTML = "";
+  holder.appendChild(pagination(page, body.data.total, SHEET_PAGE_SIZE,
+    (next) => loadCreators(owner, managerId, next)));
+}
+
+document.addEventListener("keydown", (e) => {
+  if (e.key === "Escape") closeSheet();
+});
+
+loadManagers(1);
+</script>
+</body>
+</html>
+"""
+
+
+class MockBackstageHandler(BaseHTTPRequestHandler):
+    portal = None  # set by make_server()
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_json(self, payload, status=200):
+        self.send_body(status, json.dumps(payload), "application/json")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        portal = self.portal
+        page = int(query.get("page", 1))
+        size = int(query.get("page_size", 0)) or None
+
+        if url.path == PORTAL_PATH:
+            html = (
+                PORTAL_HTML.replace("__API__", API_PREFIX)
+                .replace("__PAGE_SIZE__", str(portal.page_size))
+                .replace("__SHEET_PAGE_SIZE__", str(portal.sheet_page_size))
+            )
+            self.send_body(200, html, "text/html; charset=utf-8")
+
+        elif url.path == f"{API_PREFIX}/task/manager_list":
+            portal.sleep(portal.latency)
+            self.send_json(portal.manager_list(page, size))
+
+        elif url.path == f"{API_PREFIX}/task/anchor_list":
+            portal.sleep(portal.latency)
+            self.send_json(portal.anchor_list(query.get("manager_id", "0"), page, size))
+
+        elif url.path == f"{API_PREFIX}/anchor_profile":
+            portal.sleep(portal.profile_latency)
+            if portal.rng.random() < portal.error_rate:
+                self.send_json({"code": 500, "message": "mock error"}, status=500)
+                return
+            profile = portal.anchor_profile(query.get("display_id", ""))
+            if profile is None:
+                self.send_json({"code": 404, "message": "unknown creator"}, status=404)
+            else:
+                self.send_json(profile)
+
+        else:
+            self.send_json({"code": 404, "message": "not found"}, status=404)
+
+
+def make_server(portal, host="127.0.0.1", port=0):
+    handler = type("Handler", (MockBackstageHandler,), {"portal": portal})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def portal_url(server, month="202601"):
+    host, port = server.server_address[:2]
+    return (
+        f"http://{host}:{port}{PORTAL_PATH}"
+        f"?Month={month}&subViewTab=EligibleAnchor&viewTab=by_manager"
+    )
+
+
+# ---------------- BENCHMARK ----------------
+
+
+def configure_scraper(scraper, url, pace=None):
+    """Point scraper.py at the mock and switch off run artifacts."""
+    state = tempfile.NamedTemporaryFile(
+        "w", suffix=".json", prefix="mock_state_", delete=False
+    )
+    json.dump({"cookies": [], "origins": []}, state)
+    state.close()
+
+    scraper.DASHBOARD_URL = url
+    scraper.STATE_FILE = state.name
+    scraper.OUTPUT_FILE = None
+    scraper.CHECKPOINT_FILE = None
+    scraper.FINGERPRINT_FILE = None
+    scraper.IDENTITY_CACHE_FILE = None
+    scraper.FAILED_MANAGERS_FILE = None
+    scraper.TELEMETRY_DIR = None
+    if pace is not None:
+        # pin the pacing factor (0 = no human delays at all)
+        scraper.PACE_MIN_FACTOR = scraper.PACE_MAX_FACTOR = pace
+        scraper.pacer.factor = pace
+    return state.name
+
+
+def run_benchmark(portal, engine="sync", mode="dom", workers=1, pace=None):
+    server = make_server(portal)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    from scripts import scraper
+
+    state_file = configure_scraper(scraper, portal_url(server), pace)
+    delivered = []
+    start = time.monotonic()
+    try:
+        if engine == "api":
+            from scripts import api_scraper
+
+            api_scraper.scrape_dashboard_api(on_manager=delivered.append)
+        elif engine == "async":
+            from scripts import async_scraper
+
+            async_scraper.run_async_scraper(
+                on_manager=delivered.append, mode=mode, concurrency=workers
+            )
+        else:
+            scraper.scrape_dashboard(
+                on_manager=delivered.append, mode=mode, workers=workers
+            )
+    finally:
+        elapsed = time.monotonic() - start
+        server.shutdown()
+        os.remove(state_file)
+
+    managers = len(delivered)
+    creators = sum(len(m["creators"]) for m in delivered)
+    expected_managers, expected_creators = portal.expected()
+    rows = managers + creators
+    result = {
+        "engine": engine,
+        "mode": mode,
+        "workers": workers,
+        "pace": pace,
+        "managers": managers,
+        "creators": creators,
+        "expected_managers": expected_managers,
+        "expected_creators": expected_creators,
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(rows / elapsed, 2) if elapsed else 0.0,
+        "creators_per_second": round(creators / elapsed, 2) if elapsed else 0.0,
+        "complete": (managers, creators) == (expected_managers, expected_creators),
+        "telemetry": scraper.last_run_summary,
+    }
+
+    print("\n📈 Benchmark")
+    print(f"   engine={engine} mode={mode} workers={workers} pace={pace}")
+    print(f"   managers {managers}/{expected_managers}")
+    print(f"   creators {creators}/{expected_creators}")
+    print(f"   {elapsed:.1f}s → {result['rows_per_second']} rows/s")
+    if not result["complete"]:
+        print("⚠️ scrape was incomplete")
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mock Backstage portal")
+    parser.add_argument("command", choices=["serve", "bench"])
+    parser.add_argument("--managers", type=int, default=MOCK_MANAGERS)
+    parser.add_argument("--creators", type=int, default=MOCK_MAX_CREATORS,
+                        help="max creators per manager")
+    parser.add_argument("--page-size", type=int, default=MOCK_PAGE_SIZE)
+    parser.add_argument("--sheet-page-size", type=int, default=MOCK_SHEET_PAGE_SIZE)
+    parser.add_argument("--latency", type=float, default=MOCK_LATENCY,
+                        help="seconds per list XHR")
+    parser.add_argument("--profile-latency", type=float, default=MOCK_PROFILE_LATENCY,
+                        help="seconds per anchor_profile XHR")
+    parser.add_argument("--jitter", type=float, default=MOCK_JITTER)
+    parser.add_argument("--error-rate", type=float, default=MOCK_ERROR_RATE)
+    parser.add_argument("--seed", type=int, default=MOCK_SEED)
+    parser.add_argument("--port", type=int, default=8765, help="serve only")
+    parser.add_argument("--engine", choices=["sync", "async", "api"], default="sync")
+    parser.add_argument("--mode", choices=["dom", "network"], default="dom")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--pace", type=float, default=None,
+                        help="fixed pacing factor, 0 disables human delays")
+    parser.add_argument("--output", help="write the benchmark result as JSON")
+    args = parser.parse_args()
+
+    portal = MockPortal(
+        managers=args.managers,
+        max_creators=args.creators,
+        page_size=args.page_size,
+        sheet_page_size=args.sheet_page_size,
+        latency=args.latency,
+        profile_latency=args.profile_latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+
+    if args.command == "serve":
+        server = make_server(portal, port=args.port)
+        print(f"🧪 Mock Backstage on {portal_url(server)}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    else:
+        result = run_benchmark(
+            portal, args.engine, args.mode, args.workers, args.pace
+        )
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
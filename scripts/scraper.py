@@ -1,12 +1,20 @@
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 import os
+import re
+from urllib.parse import parse_qsl, urlencode, urlparse
 from playwright.sync_api import sync_playwright, TimeoutError
 import json, time, random
+import hashlib
+import signal
+import threading
 
 today = datetime.today()
 month_str = today.strftime("%Y%m")
 # month_str = "202601"
 
+# other months: set_month() / scrape_months() (--month, --months)
 DASHBOARD_URL = (
     f"https://live-backstage.tiktok.com/portal/revenue/task"
     f"?Month={month_str}"
@@ -22,12 +30,404 @@ OUTPUT_FILE = None
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 STATE_FILE = os.path.join(BASE_DIR, "state.json")
 
+# append-only JSONL checkpoint, one record per creator / manager
+# (`python scripts/scraper.py --resume` continues a crashed run from it)
+CHECKPOINT_FILE = os.path.join(BASE_DIR, "checkpoint.jsonl")
+CHECKPOINT_FSYNC_EVERY = 50
+
+# incremental mode: skip the creator sidesheet of managers whose summary row
+# is identical to the previous run (fingerprints are kept per month)
+INCREMENTAL = False
+FINGERPRINT_FILE = os.path.join(BASE_DIR, "fingerprints.json")
+
+# creator identity (CreatorID, AgentID, AgentName, nickname, GroupName) seen
+# in earlier runs, so known creators skip the avatar hover + profile XHR
+IDENTITY_CACHE_FILE = os.path.join(BASE_DIR, "identity_cache.json")
+IDENTITY_CACHE_TTL_DAYS = 30
+IDENTITY_CACHE_SAVE_EVERY = 100
+
+# failure isolation: a manager / sidesheet page is retried on its own a few
+# times; managers that still fail are re-scraped once at the end of the run
+# and kept in FAILED_MANAGERS_FILE for `--retry-failed`
+MANAGER_RETRIES = 3
+SHEET_PAGE_RETRIES = 3
+RETRY_FAILED_AT_END = True
+FAILED_MANAGERS_FILE = os.path.join(BASE_DIR, "failed_managers.json")
+
+# run telemetry: <run>.json summary + <run>.events.jsonl per scrape
+TELEMETRY_DIR = os.path.join(os.path.dirname(BASE_DIR), "logs", "scraper")
+XHR_LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 3, 5)  # seconds
+
+# "dom"     -> read every table cell + hover avatars for the profile XHR
+# "network" -> read the JSON of the list APIs the page already downloads
+# "api"     -> no browser, call the list APIs with the cookies of STATE_FILE
+#              (api_scraper.py)
+SCRAPE_MODE = "dom"
+
+# number of browser contexts scraping manager pages side by side
+SCRAPE_WORKERS = 1
+
+# browser lifecycle: the page's context is re-created every N managers to
+# cap renderer memory on long runs (0 = never); a stage (dashboard load,
+# manager sidesheet, page change) running past STAGE_DEADLINE seconds gets
+# its browser killed by the watchdog and the run re-opens it on the same
+# manager page (None = no watchdog)
+RECYCLE_AFTER_MANAGERS = 150
+STAGE_DEADLINE = 300
+BROWSER_RESTARTS_PER_PAGE = 3
+
+# "full" -> desktop-sized window as before
+# "lean" -> small viewport, no GPU / extensions / background traffic
+LAUNCH_PROFILE = "full"
+LAUNCH_PROFILES = {
+    "full": {
+        "args": ["--start-maximized"],
+        "viewport": {"width": 1920, "height": 1080},
+    },
+    "lean": {
+        "args": [
+            "--disable-gpu",
+            "--disable-extensions",
+            "--disable-dev-shm-usage",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--no-first-run",
+            "--mute-audio",
+        ],
+        "viewport": {"width": 1280, "height": 800},
+    },
+}
+
+# adaptive pacing: every human_delay() range is scaled by a factor that
+# shrinks while the portal answers fast and grows on slow / failed XHRs
+PACE_MIN_FACTOR = 0.15
+PACE_MAX_FACTOR = 3.0
+PACE_SLOW_LATENCY = 2.5  # seconds to first byte that count as "slow"
+PACE_SPEEDUP = 0.97  # per healthy XHR
+PACE_BACKOFF = 1.5  # per slow / non-200 XHR
+PACE_TIMEOUT_BACKOFF = 2.0  # per XHR timeout
+
+# requests aborted through context.route; the document, scripts, styles and
+# the XHRs we read always go through (empty both to switch blocking off)
+BLOCK_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCK_URL_PATTERNS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "analytics.tiktok.com",
+    "mon.tiktokv.com",
+    "mcs.tiktokw",
+    "/monitor_browser/",
+    "/slardar/",
+)
+
+# URL fragments of the list APIs behind the manager table and the creator
+# sidesheet (check the portal's network tab if TikTok renames them)
+MANAGER_LIST_API = "task/manager_list"
+CREATOR_LIST_API = "task/anchor_list"
+LIST_API_TIMEOUT = 10000
+
+# JSON key candidates for every column, first non-empty one wins
+MANAGER_API_FIELDS = {
+    "Creator Network manager": ("ManagerName", "AgentName", "manager_name"),
+    "Eligible creators": ("EligibleAnchorCount", "EligibleCreators", "eligible_cnt"),
+    "Estimated bonus contribution": ("EstimatedBonus", "BonusContribution"),
+    "Diamonds": ("Diamonds", "diamonds"),
+    "M0.5": ("M05", "M0_5", "Milestone05"),
+    "M1": ("M1", "Milestone1"),
+    "M2": ("M2", "Milestone2"),
+    "M1R": ("M1R", "MilestoneM1R"),
+}
+CREATOR_API_FIELDS = {
+    "Estimated bonus contribution": ("EstimatedBonus", "BonusContribution"),
+    "Achieved milestones": ("AchievedMilestones", "Milestones"),
+    "Diamonds": ("Diamonds", "diamonds"),
+    "Valid go LIVE days": ("ValidLiveDays", "ValidGoLiveDays"),
+    "LIVE duration": ("LiveDuration", "live_duration"),
+}
+
+
+MANAGER_ROW_SELECTOR = "tbody.semi-table-tbody > tr"
+CREATOR_ROW_SELECTOR = (
+    '[role="dialog"] [role="row"][aria-rowindex],'
+    ' .semi-sidesheet [role="row"][aria-rowindex]'
+)
+
+# aria-colindex -> output column
+MANAGER_COLUMNS = {
+    "2": "Creator Network manager",
+    "3": "Eligible creators",
+    "4": "Estimated bonus contribution",
+    "5": "Diamonds",
+    "6": "M0.5",
+    "7": "M1",
+    "8": "M2",
+    "9": "M1R",
+}
+CREATOR_COLUMNS = {
+    "2": "Estimated bonus contribution",
+    "3": "Achieved milestones",
+    "4": "Diamonds",
+    "5": "Valid go LIVE days",
+    "6": "LIVE duration",
+}
+
+SIDESHEET_SELECTOR = '[role="dialog"], .semi-sidesheet, .semi-modal'
+
+# hard deadlines (ms) for the event-driven waits
+LOAD_DEADLINE = 15000
+ROWS_DEADLINE = 10000
+SIDESHEET_DEADLINE = 5000
+
+# resolves with a signature of the rows matching `selector` once there are
+# rows and they differ from `previous` (i.e. the requested page rendered)
+WAIT_ROWS_JS = """
+([selector, previous]) => {
+    const rows = Array.from(document.querySelectorAll(selector));
+    if (!rows.length) return null;
+    const signature = rows
+        .map((row) => row.getAttribute("aria-rowindex") + ":" + (row.innerText || "").trim())
+        .join("\\n");
+    return signature !== previous ? signature : null;
+}
+"""
+
+# every row matching `selector` with its aria-colindex cells, in DOM order
+# (same order as page.locator(selector).nth(i))
+EXTRACT_ROWS_JS = """
+(selector) => Array.from(document.querySelectorAll(selector)).map((row, index) => {
+    const cells = {};
+    row.querySelectorAll("[aria-colindex]").forEach((cell) => {
+        cells[cell.getAttribute("aria-colindex")] = (cell.innerText || "").trim();
+    });
+    return { index, rowindex: row.getAttribute("aria-rowindex"), cells };
+})
+"""
+
+
+# ---------------- TELEMETRY ----------------
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class ScrapeTelemetry:
+    """
+    Per-stage timings, counters and XHR latency histograms of one run.
+    Every observation is also streamed to a JSONL event log; finish()
+    writes the JSON summary next to it.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = None
+        self.reset()
+
+    def reset(self):
+        self.month = None
+        self.started = None
+        self.started_at = None
+        self.stages = {}
+        self.counters = {}
+        self.histograms = {}
+        self.summary_path = None
+        self.events_path = None
+
+    def start(self, month):
+        with self.lock:
+            self.reset()
+            self.month = month
+            self.started = time.monotonic()
+            self.started_at = datetime.now().isoformat(timespec="seconds")
+            if TELEMETRY_DIR:
+                os.makedirs(TELEMETRY_DIR, exist_ok=True)
+                name = f"scrape_{month}_{datetime.now():%Y%m%d_%H%M%S}"
+                self.summary_path = os.path.join(TELEMETRY_DIR, name + ".json")
+                self.events_path = os.path.join(TELEMETRY_DIR, name + ".events.jsonl")
+                self.events = open(self.events_path, "a", encoding="utf-8")
+
+    def _event(self, event):
+        if self.events:
+            event["ts"] = round(time.time(), 3)
+            self.events.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    @contextmanager
+    def stage(self, name, **tags):
+        """Time a block; the yielded dict can be filled with extra tags."""
+        start = time.monotonic()
+        status = "ok"
+        try:
+            yield tags
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            seconds = time.monotonic() - start
+            with self.lock:
+                stats = self.stages.setdefault(name, {"durations": [], "errors": 0})
+                stats["durations"].append(seconds)
+                if status != "ok":
+                    stats["errors"] += 1
+                self._event(
+                    {
+                        "event": "stage",
+                        "stage": name,
+                        "seconds": round(seconds, 3),
+                        "status": status,
+                        **tags,
+                    }
+                )
+
+    def count(self, name, n=1, **tags):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+            if tags:
+                self._event({"event": "count", "name": name, "n": n, **tags})
+
+    def observe(self, name, seconds, status="ok"):
+        with self.lock:
+            hist = self.histograms.setdefault(
+                name, {"buckets": [0] * (len(XHR_LATENCY_BUCKETS) + 1), "values": []}
+            )
+            i = 0
+            while i < len(XHR_LATENCY_BUCKETS) and seconds > XHR_LATENCY_BUCKETS[i]:
+                i += 1
+            hist["buckets"][i] += 1
+            hist["values"].append(seconds)
+            self._event(
+                {
+                    "event": "xhr",
+                    "name": name,
+                    "seconds": round(seconds, 3),
+                    "status": status,
+                }
+            )
+
+    def summary(self, **extra):
+        stages = {}
+        for name, stats in self.stages.items():
+            durations = stats["durations"]
+            stages[name] = {
+                "count": len(durations),
+                "errors": stats["errors"],
+                "total_seconds": round(sum(durations), 3),
+                "mean_seconds": round(sum(durations) / len(durations), 3),
+                "p50_seconds": round(_percentile(durations, 0.5), 3),
+                "p95_seconds": round(_percentile(durations, 0.95), 3),
+                "max_seconds": round(max(durations), 3),
+            }
+
+        histograms = {}
+        for name, hist in self.histograms.items():
+            labels = [f"le_{b}" for b in XHR_LATENCY_BUCKETS] + ["inf"]
+            histograms[name] = {
+                "buckets": dict(zip(labels, hist["buckets"])),
+                "count": len(hist["values"]),
+                "p50_seconds": round(_percentile(hist["values"], 0.5), 3),
+                "p95_seconds": round(_percentile(hist["values"], 0.95), 3),
+            }
+
+        return {
+            "month": self.month,
+            "started_at": self.started_at,
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "wall_seconds": round(time.monotonic() - (self.started or 0), 3),
+            "stages": stages,
+            "counters": dict(self.counters),
+            "histograms": histograms,
+            **extra,
+        }
+
+    def finish(self, **extra):
+        with self.lock:
+            summary = self.summary(**extra)
+            if self.events:
+                self.events.close()
+                self.events = None
+            if self.summary_path:
+                with open(self.summary_path, "w", encoding="utf-8") as f:
+                    json.dump(summary, f, indent=2, ensure_ascii=False)
+                print(f"📊 Telemetry: {self.summary_path}")
+        return summary
+
+
+telemetry = ScrapeTelemetry()
+last_run_summary = None
+
 
 # ---------------- UTILITIES ----------------
 
 
+class PaceController:
+    """
+    Scales the scraper's pauses by how healthy the portal looks.
+    Fed by page responses (latency / status) and XHR timeouts; shared by
+    every page and worker of the process.
+    """
+
+    def __init__(self):
+        self.factor = 1.0
+        self.lock = threading.Lock()
+        self.healthy = 0
+        self.slow = 0
+        self.failed = 0
+        self.timeouts = 0
+
+    def _scale(self, by):
+        self.factor = min(PACE_MAX_FACTOR, max(PACE_MIN_FACTOR, self.factor * by))
+
+    def on_response(self, response):
+        request = response.request
+        if request.resource_type not in ("xhr", "fetch"):
+            return
+
+        latency = max(request.timing.get("responseStart", 0), 0) / 1000
+        with self.lock:
+            if response.status >= 400:
+                telemetry.count("non_2xx_responses", status=response.status)
+                self.failed += 1
+                self._scale(PACE_BACKOFF)
+                print(f"🐢 {response.status} from portal → pace x{self.factor:.2f}")
+            elif latency > PACE_SLOW_LATENCY:
+                self.slow += 1
+                self._scale(PACE_BACKOFF)
+                print(f"🐢 slow XHR ({latency:.1f}s) → pace x{self.factor:.2f}")
+            else:
+                self.healthy += 1
+                self._scale(PACE_SPEEDUP)
+
+    def record_timeout(self):
+        telemetry.count("timeouts")
+        with self.lock:
+            self.timeouts += 1
+            self._scale(PACE_TIMEOUT_BACKOFF)
+            print(f"🐢 XHR timeout → pace x{self.factor:.2f}")
+
+    def watch(self, page):
+        page.on("response", self.on_response)
+
+    def delay_for(self, a, b):
+        return random.randint(a, b) / 1000 * self.factor
+
+    def pause(self, a, b, page=None):
+        seconds = self.delay_for(a, b)
+        telemetry.count("delay_seconds", seconds)
+        if page:
+            page.wait_for_timeout(seconds * 1000)
+        else:
+            time.sleep(seconds)
+
+
+pacer = PaceController()
+
+
 def human_delay(a=800, b=1500):
-    time.sleep(random.randint(a, b) / 1000)
+    pacer.pause(a, b)
 
 
 def safe_text(locator, timeout=4000):
@@ -44,6 +444,28 @@ def save_progress(data):
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
+def wait_for_rows(page, selector, previous=None, timeout=ROWS_DEADLINE):
+    """
+    Wait until `selector` has rows that differ from the `previous` signature.
+    Returns the new signature (or `previous` when the deadline passed).
+    """
+    with telemetry.stage("wait_rows") as tags:
+        try:
+            handle = page.wait_for_function(
+                WAIT_ROWS_JS, arg=[selector, previous], polling=100, timeout=timeout
+            )
+            return handle.json_value()
+        except TimeoutError:
+            tags["timed_out"] = True
+            print(f"⚠️ rows did not change within {timeout}ms")
+            pacer.record_timeout()
+            return previous
+
+
+def rows_signature(page, selector):
+    return page.evaluate(WAIT_ROWS_JS, [selector, None]) or ""
+
+
 def close_modal(page):
     try:
         btn = page.locator(
@@ -51,12 +473,19 @@ def close_modal(page):
         ).first
         if btn.count():
             btn.click()
-            page.wait_for_timeout(500)
         else:
             page.keyboard.press("Escape")
     except:
         page.keyboard.press("Escape")
 
+    try:
+        page.wait_for_selector(
+            SIDESHEET_SELECTOR, state="hidden", timeout=SIDESHEET_DEADLINE
+        )
+    except TimeoutError:
+        print("⚠️ sidesheet still open, pressing Escape")
+        page.keyboard.press("Escape")
+
 
 def normalize_creator(data):
     host_info = data.get("HostBaseInfo", {})
@@ -73,247 +502,1329 @@ def normalize_creator(data):
     }
 
 
-# ---------------- MAIN SCRAPER ----------------
+def emit_manager(manager, on_manager, final_data):
+    if on_manager:
+        on_manager(manager)
+    else:
+        final_data.append(manager)
+    save_progress(final_data)
 
 
-def scrape_dashboard(on_manager=None):
-    global scrape_succeeded
-    print("🟢 SCRAPER STARTED → load_data.py called me")
+def build_creator(creator_name, cells, creator_xhr):
+    """
+    cells -> {"Estimated bonus contribution": ..., "Diamonds": ..., ...}
+    creator_xhr -> normalize_creator() output (may be empty)
+    """
+    return {
+        "CreatorID": creator_xhr.get("CreatorID", "N/A"),
+        "ManagerEmail": creator_xhr.get("AgentName", "N/A"),
+        "Creator": creator_name,
+        "Estimated bonus contribution": cells.get("Estimated bonus contribution", ""),
+        "Achieved milestones": cells.get("Achieved milestones", ""),
+        "Diamonds": cells.get("Diamonds", ""),
+        "Valid go LIVE days": cells.get("Valid go LIVE days", ""),
+        "LIVE duration": cells.get("LIVE duration", ""),
+        "CreatorName": creator_xhr.get("nickname", ""),
+        "ManagerID": creator_xhr.get("AgentID", ""),
+        "GroupName": creator_xhr.get("GroupName", ""),
+    }
 
-    MAX_RETRIES = 10
-    retry = 0
 
-    while retry < MAX_RETRIES:
-        final_data = []
-        scrape_succeeded = False
-        manager_page = 1
+# ---------------- CHECKPOINT ----------------
+
+
+class CheckpointWriter:
+    """
+    Appends one JSON record per line and fsyncs every `fsync_every` records.
+    Records: run, creator, creator_page (sidesheet page finished),
+    manager (manager finished, without creators), manager_page.
+    """
+
+    def __init__(self, path, fsync_every=CHECKPOINT_FSYNC_EVERY):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.pending = 0
+        self.lock = threading.Lock()
+        self.f = open(path, "a", encoding="utf-8")
+        if self.f.tell():
+            # never glue a new record onto a torn last line
+            self.f.write("\n")
+
+    def write(self, record):
+        with self.lock:
+            self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.pending += 1
+            if self.pending >= self.fsync_every:
+                self._sync()
+
+    def _sync(self):
+        self.f.flush()
+        os.fsync(self.f.fileno())
+        self.pending = 0
+
+    def write_creator_page(self, manager_name, sheet_page, creators):
+        for creator in creators:
+            self.write(
+                {
+                    "type": "creator",
+                    "manager": manager_name,
+                    "page": sheet_page,
+                    "creator": creator,
+                }
+            )
+        self.write({"type": "creator_page", "manager": manager_name, "page": sheet_page})
+
+    def write_manager(self, manager):
+        summary = {k: v for k, v in manager.items() if k != "creators"}
+        self.write({"type": "manager", "manager": summary})
+
+    def write_manager_page(self, manager_page):
+        self.write({"type": "manager_page", "page": manager_page})
+
+    def close(self):
+        with self.lock:
+            self._sync()
+            self.f.close()
+
+
+class CheckpointState:
+    """What a previous run of the same month already finished."""
+
+    def __init__(self):
+        self.managers = []  # finished managers, creators included
+        self.sheet_pages = {}  # manager name -> {sidesheet page: [creators]}
+        self.manager_pages = set()
+
+    def done_managers(self):
+        return {m["Creator Network manager"] for m in self.managers}
+
+
+def load_checkpoint(path, month):
+    state = CheckpointState()
+    if not path or not os.path.exists(path):
+        return state
+
+    pending = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn line from a crash
+
+            kind = record.get("type")
+            if kind == "run":
+                if record.get("month") != month:
+                    return CheckpointState()
+            elif kind == "creator":
+                key = (record["manager"], record["page"])
+                pending.setdefault(key, []).append(record["creator"])
+            elif kind == "creator_page":
+                key = (record["manager"], record["page"])
+                state.sheet_pages.setdefault(record["manager"], {})[
+                    record["page"]
+                ] = pending.pop(key, [])
+            elif kind == "manager":
+                manager = dict(record["manager"])
+                pages = state.sheet_pages.pop(manager["Creator Network manager"], {})
+                manager["creators"] = [
+                    c for n in sorted(pages) for c in pages[n]
+                ]
+                state.managers.append(manager)
+            elif kind == "manager_page":
+                state.manager_pages.add(record["page"])
+
+    print(
+        f"♻️ Checkpoint: {len(state.managers)} managers, "
+        f"{len(state.manager_pages)} manager pages already done"
+    )
+    return state
+
+
+# ---------------- INCREMENTAL ----------------
+
+
+def manager_fingerprint(manager):
+    summary = {k: v for k, v in manager.items() if k != "creators"}
+    raw = json.dumps(summary, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class FingerprintStore:
+    """
+    {month: {manager name: fingerprint}} kept in FINGERPRINT_FILE.
+    A fingerprint is only recorded once the manager was fully delivered.
+    """
+
+    def __init__(self, path, month):
+        self.path = path
+        self.month = month
+        self.data = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.data = json.load(f)
+        self.previous = dict(self.data.get(month, {}))
+        self.current = self.data.setdefault(month, {})
+
+    def unchanged(self, manager):
+        name = manager["Creator Network manager"]
+        return self.previous.get(name) == manager_fingerprint(manager)
+
+    def record(self, manager):
+        self.current[manager["Creator Network manager"]] = manager_fingerprint(manager)
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+
+# ---------------- IDENTITY CACHE ----------------
+
+
+class IdentityCache:
+    """
+    normalize_creator() results keyed by "manager|creator display name".
+    Entries older than `ttl_days` are treated as unknown; `refresh=True`
+    ignores every entry but still records the fresh XHR results.
+    """
+
+    def __init__(self, path, ttl_days=IDENTITY_CACHE_TTL_DAYS, refresh=False):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.refresh = refresh
+        self.lock = threading.Lock()
+        self.unsaved = 0
+        self.hits = 0
+        self.misses = 0
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def key(manager_name, creator_name):
+        return f"{manager_name}|{creator_name}"
+
+    def get(self, manager_name, creator_name):
+        with self.lock:
+            entry = None
+            if not self.refresh:
+                entry = self.entries.get(self.key(manager_name, creator_name))
+            if entry and time.time() - entry.get("fetched_at", 0) < self.ttl:
+                self.hits += 1
+                return entry["identity"]
+            self.misses += 1
+            return None
+
+    def put(self, manager_name, creator_name, identity):
+        if not identity or not identity.get("CreatorID"):
+            return
+        with self.lock:
+            self.entries[self.key(manager_name, creator_name)] = {
+                "identity": identity,
+                "fetched_at": time.time(),
+            }
+            self.unsaved += 1
+            if self.unsaved >= IDENTITY_CACHE_SAVE_EVERY:
+                self._save()
+
+    def _save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self.unsaved = 0
+
+    def save(self):
+        with self.lock:
+            if self.unsaved:
+                self._save()
+        print(f"🪪 Identity cache: {self.hits} hits, {self.misses} misses")
+
+
+# ---------------- FAILED MANAGERS ----------------
+
+
+def load_failed_managers(path, month):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get(month, {})
+
+
+def save_failed_managers(path, month, failed):
+    data = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    if failed:
+        data[month] = failed
+    else:
+        data.pop(month, None)
 
-        with sync_playwright() as p:
-            # browser = p.chromium.launch(headless=False, args=["--start-maximized"])
-            browser = p.chromium.launch(headless=True, args=["--start-maximized"])
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+# ---------------- RUN STATE ----------------
+
+
+class ScrapeRun:
+    """State shared by everything that scrapes one dashboard run."""
+
+    def __init__(
+        self,
+        on_manager=None,
+        checkpoint=None,
+        resume_state=None,
+        fingerprints=None,
+        identities=None,
+    ):
+        self.on_manager = on_manager
+        self.checkpoint = checkpoint
+        self.fingerprints = fingerprints
+        self.identities = identities
+        self.resume = resume_state or CheckpointState()
+        self.final_data = []
+        self.emitted = self.resume.done_managers()
+        self.failed = {}  # manager name -> last error
+        self.only = None  # restrict the run to these manager names
+        self.lock = threading.Lock()
+
+        if on_manager is None:
+            # managers finished before the crash are part of the result
+            self.final_data.extend(self.resume.managers)
+
+    def is_done(self, manager_name):
+        return manager_name in self.emitted
+
+    def wanted(self, manager_name):
+        return self.only is None or manager_name in self.only
+
+    def pending_only(self):
+        """Managers of the `only` filter not delivered or failed yet."""
+        return self.only - self.emitted - set(self.failed)
+
+    def mark_missing(self):
+        """Managers of the `only` filter that never showed up are failures."""
+        for name in self.pending_only():
+            self.failed[name] = "not found on re-scrape"
+
+    def fail(self, manager, error):
+        with self.lock:
+            self.failed[manager["Creator Network manager"]] = str(error)
+
+    def unchanged(self, manager):
+        return bool(self.fingerprints) and self.fingerprints.unchanged(manager)
+
+    def emit(self, manager, complete=True):
+        """
+        Deliver a finished manager. `complete=False` marks a manager whose
+        sidesheet could not be read, so it is never fingerprinted as done.
+        """
+        with self.lock:
+            # a retried / resumed page re-reads managers that already went out
+            if self.is_done(manager["Creator Network manager"]):
+                return
+            self.emitted.add(manager["Creator Network manager"])
+            self.failed.pop(manager["Creator Network manager"], None)
+            emit_manager(manager, self.on_manager, self.final_data)
+            if self.checkpoint:
+                self.checkpoint.write_manager(manager)
+            if self.fingerprints and complete:
+                self.fingerprints.record(manager)
+
+    def sheet_page_done(self, manager_name, sheet_page):
+        return self.resume.sheet_pages.get(manager_name, {}).get(sheet_page)
+
+    def finish_sheet_page(self, manager_name, sheet_page, creators):
+        if self.checkpoint:
+            self.checkpoint.write_creator_page(manager_name, sheet_page, creators)
+
+    def finish_manager_page(self, manager_page):
+        self.resume.manager_pages.add(manager_page)
+        if self.checkpoint:
+            self.checkpoint.write_manager_page(manager_page)
+
+    def close(self):
+        if self.checkpoint:
+            self.checkpoint.close()
+        if self.fingerprints:
+            self.fingerprints.save()
+        if self.identities:
+            self.identities.save()
+        if FAILED_MANAGERS_FILE:
+            save_failed_managers(FAILED_MANAGERS_FILE, month_str, self.failed)
+        if self.failed:
+            print(f"⚠️ {len(self.failed)} managers failed: {sorted(self.failed)}")
+
+        global last_run_summary
+        last_run_summary = telemetry.finish(
+            managers_delivered=len(self.emitted),
+            managers_failed=len(self.failed),
+            pace_factor=round(pacer.factor, 3),
+            responses={
+                "healthy": pacer.healthy,
+                "slow": pacer.slow,
+                "failed": pacer.failed,
+                "timeouts": pacer.timeouts,
+            },
+        )
+
+
+def start_run(
+    on_manager=None,
+    resume=False,
+    incremental=None,
+    refresh_identities=False,
+    retry_failed=False,
+):
+    """
+    Build the ScrapeRun for a fresh or resumed scrape.
+    Without `resume` the checkpoint file is started over.
+    `retry_failed` limits the run to FAILED_MANAGERS_FILE of this month.
+    """
+    telemetry.start(month_str)
+    # a retry pass keeps (and respects) the checkpoint of the main run
+    run = _build_run(on_manager, resume or retry_failed, incremental, refresh_identities)
+    if retry_failed:
+        run.only = set(load_failed_managers(FAILED_MANAGERS_FILE, month_str))
+        print(f"🔁 Re-scraping {len(run.only)} previously failed managers")
+    return run
+
+
+def _build_run(on_manager, resume, incremental, refresh_identities):
+    if incremental is None:
+        incremental = INCREMENTAL
+    fingerprints = FingerprintStore(FINGERPRINT_FILE, month_str) if incremental else None
+    identities = None
+    if IDENTITY_CACHE_FILE:
+        identities = IdentityCache(IDENTITY_CACHE_FILE, refresh=refresh_identities)
+
+    if not CHECKPOINT_FILE:
+        return ScrapeRun(
+            on_manager, fingerprints=fingerprints, identities=identities
+        )
+
+    state = load_checkpoint(CHECKPOINT_FILE, month_str) if resume else None
+    has_progress = state and (
+        state.managers or state.sheet_pages or state.manager_pages
+    )
+    if not has_progress:
+        open(CHECKPOINT_FILE, "w").close()
+
+    checkpoint = CheckpointWriter(CHECKPOINT_FILE)
+    if not has_progress:
+        checkpoint.write({"type": "run", "month": month_str})
+    return ScrapeRun(on_manager, checkpoint, state, fingerprints, identities)
+
+
+# ---------------- LIST API CAPTURE ----------------
+
+
+def _api_value(item, keys):
+    for key in keys:
+        value = item.get(key)
+        if value in (None, ""):
+            continue
+        if isinstance(value, list):
+            return "\n".join(str(v) for v in value)
+        return str(value)
+    return ""
+
+
+def _find_rows(payload):
+    """
+    Return the first list of dicts inside a list API payload.
+    Backstage wraps rows differently per endpoint (data.list, data.rows, ...)
+    """
+    queue = deque([payload])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, list):
+            if node and all(isinstance(v, dict) for v in node):
+                return node
+            queue.extend(node)
+        elif isinstance(node, dict):
+            queue.extend(node.values())
+    return []
+
+
+class ListApiCollector:
+    """
+    Buffers manager / creator list API responses seen by the page.
+    Bodies are parsed lazily in take() so the event handler stays cheap.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.responses = {"manager": deque(), "creator": deque()}
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if MANAGER_LIST_API in response.url:
+            self.responses["manager"].append(response)
+        elif CREATOR_LIST_API in response.url:
+            self.responses["creator"].append(response)
+
+    def clear(self, kind):
+        self.responses[kind].clear()
+
+    def take(self, kind, timeout=LIST_API_TIMEOUT):
+        deadline = time.monotonic() + timeout / 1000
+        while not self.responses[kind]:
+            if time.monotonic() > deadline:
+                pacer.record_timeout()
+                raise TimeoutError(f"No {kind} list response within {timeout}ms")
+            self.page.wait_for_timeout(50)
+
+        response = self.responses[kind].popleft()
+        if response.status != 200:
+            raise TimeoutError(f"{kind} list API returned {response.status}")
+        return _find_rows(response.json())
+
+
+def manager_from_api(item):
+    manager = {
+        column: _api_value(item, keys) for column, keys in MANAGER_API_FIELDS.items()
+    }
+    manager["creators"] = []
+    return manager
+
+
+def creator_from_api(item):
+    identity = normalize_creator(item)
+    cells = {column: _api_value(item, keys) for column, keys in CREATOR_API_FIELDS.items()}
+    creator_name = identity.get("display_id") or _api_value(
+        item, ("Creator", "CreatorName")
+    )
+    return build_creator(creator_name, cells, identity)
+
+
+def find_manager_row(page, manager_name):
+    name_cell = page.locator(
+        '[aria-colindex="2"]',
+        has_text=re.compile(rf"^\s*{re.escape(manager_name)}\s*$"),
+    )
+    return page.locator(MANAGER_ROW_SELECTOR).filter(has=name_cell).first
+
+
+def find_creator_row(page, creator_name):
+    name_cell = page.locator(
+        '[aria-colindex="1"]',
+        has_text=re.compile(rf"^\s*{re.escape(creator_name)}\s*$"),
+    )
+    return page.locator(CREATOR_ROW_SELECTOR).filter(has=name_cell).first
+
+
+# ---------------- WATCHDOG ----------------
+
+
+class BrowserHung(Exception):
+    """The watchdog killed a browser whose stage ran past STAGE_DEADLINE."""
+
+
+def _process_table():
+    """{pid: (parent pid, command name)} from /proc, {} where there is none."""
+    table = {}
+    if not os.path.isdir("/proc"):
+        return table
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as f:
+                stat = f.read()
+        except OSError:
+            continue  # exited meanwhile
+        # "pid (comm) state ppid ...", comm may contain spaces
+        comm = stat[stat.index("(") + 1 : stat.rindex(")")]
+        ppid = int(stat[stat.rindex(")") + 2 :].split()[1])
+        table[int(entry)] = (ppid, comm)
+    return table
+
+
+def _descendants(root, table):
+    children = {}
+    for pid, (ppid, _) in table.items():
+        children.setdefault(ppid, []).append(pid)
+    found = []
+    queue = deque(children.get(root, []))
+    while queue:
+        pid = queue.popleft()
+        found.append(pid)
+        queue.extend(children.get(pid, []))
+    return found
+
+
+def _browser_pids():
+    """Chromium processes started (through the Playwright driver) by us."""
+    table = _process_table()
+    return {
+        pid
+        for pid in _descendants(os.getpid(), table)
+        if "chrom" in table[pid][1].lower() or "headless" in table[pid][1].lower()
+    }
+
+
+class BrowserWatchdog:
+    """
+    Kills the Chromium of a stage that runs past STAGE_DEADLINE, so the
+    Playwright call stuck on it raises instead of hanging the run for hours.
+    The sync API can't be used from another thread, hence the kill: the
+    browser processes are looked up in /proc when the browser is launched.
+    Where there is no /proc the overrun is only reported.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.launch_lock = threading.Lock()
+        self.pids = {}  # id(browser) -> its top-level Chromium pids
+        self.guards = {}  # token -> [deadline, browser, stage, fired]
+        self.thread = None
+
+    def launch(self, launch):
+        """Run `launch()` and remember the Chromium processes it started."""
+        with self.launch_lock:
+            before = _browser_pids()
+            browser = launch()
+            pids = _browser_pids() - before
+        with self.lock:
+            self.pids[id(browser)] = pids
+        return browser
+
+    def forget(self, browser):
+        with self.lock:
+            self.pids.pop(id(browser), None)
+
+    @contextmanager
+    def guard(self, stage, browser, deadline=None):
+        """Raise BrowserHung out of the block if the watchdog had to kill."""
+        deadline = deadline or STAGE_DEADLINE
+        if not deadline:
+            yield
+            return
+
+        token = object()
+        guard = [time.monotonic() + deadline, browser, stage, False]
+        with self.lock:
+            self.guards[token] = guard
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self._watch, name="browser-watchdog", daemon=True
+                )
+                self.thread.start()
+        try:
+            yield
+        except Exception as e:
+            if guard[3]:
+                raise BrowserHung(f"{stage} ran past {deadline}s") from e
+            raise
+        finally:
+            with self.lock:
+                self.guards.pop(token, None)
+        if guard[3]:
+            raise BrowserHung(f"{stage} ran past {deadline}s")
+
+    def _watch(self):
+        while True:
+            time.sleep(1)
+            now = time.monotonic()
+            with self.lock:
+                expired = [g for g in self.guards.values() if not g[3] and g[0] < now]
+                for guard in expired:
+                    guard[3] = True
+            for _, browser, stage, _ in expired:
+                self.kill(browser, stage)
+
+    def kill(self, browser, stage):
+        telemetry.count("watchdog_kills", stage=stage)
+        with self.lock:
+            roots = self.pids.get(id(browser), set())
+        if not roots:
+            print(f"⏰ {stage} is hung, but its browser process is unknown")
+            return
+
+        print(f"⏰ {stage} missed its deadline → killing the browser")
+        table = _process_table()
+        for root in roots:
+            for pid in _descendants(root, table) + [root]:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except OSError:
+                    pass
+
+
+watchdog = BrowserWatchdog()
+
+
+# ---------------- PAGE SCRAPERS ----------------
+
+
+def fetch_creator_identity(page, crow, creator_name):
+    """Hover the avatar and read the anchor_profile XHR it triggers."""
+    crow.scroll_into_view_if_needed()
+    # leave the previous avatar so the hover below fires a fresh XHR
+    page.mouse.move(0, 0)
+
+    start = time.monotonic()
+    try:
+        with page.expect_response(
+            lambda r: "anchor_profile" in r.url,
+            timeout=5000,
+        ) as resp:
+            crow.locator("span.avatarContainer-yJA0K2").hover(force=True)
+
+        response = resp.value
+        text = response.text()
+        status = response.status
+        telemetry.observe("anchor_profile", time.monotonic() - start, status)
 
-            ctx = browser.new_context(
-                storage_state=STATE_FILE,
-                viewport={"width": 1920, "height": 1080},
+        if status != 200:
+            telemetry.count("anchor_profile_non_200")
+            print(f"❌ Non-200 response ({status}) for {creator_name}")
+            print(text[:300])
+            return None  # skip this creator
+
+        if not text.strip():
+            print(f"⚠️ Empty response body for {creator_name}")
+            return None  # skip
+
+        try:
+            data = response.json()
+        except Exception as e:
+            print(f"❌ JSON decode failed for {creator_name}: {e}")
+            print("Response preview:", text[:300])
+            return None
+
+        creator_xhr = normalize_creator(data)
+
+        print(
+            f" XHR OK: {creator_xhr.get('AgentName')} | "
+            f"{creator_xhr.get('CreatorID')}"
+        )
+        return creator_xhr
+
+    except TimeoutError:
+        print("⚠️ XHR timeout:", creator_name)
+        telemetry.count("anchor_profile_timeouts", creator=creator_name)
+        pacer.record_timeout()
+        return {}
+
+
+def lookup_creator_identity(page, crow, manager_name, creator_name, identities):
+    """Identity cache first, avatar hover + anchor_profile XHR on a miss."""
+    if identities:
+        cached = identities.get(manager_name, creator_name)
+        if cached:
+            telemetry.count("identity_cache_hits")
+            return cached
+        telemetry.count("identity_cache_misses")
+
+    creator_xhr = fetch_creator_identity(page, crow, creator_name)
+    if identities and creator_xhr:
+        identities.put(manager_name, creator_name, creator_xhr)
+    return creator_xhr
+
+
+def extract_rows(page, selector):
+    """One evaluate() for every row/cell of the table page currently shown."""
+    return page.evaluate(EXTRACT_ROWS_JS, selector)
+
+
+def build_manager(cells):
+    manager = {column: cells.get(i, "") for i, column in MANAGER_COLUMNS.items()}
+    manager["creators"] = []
+    return manager
+
+
+def iter_manager_rows_dom(page):
+    rows = page.locator(MANAGER_ROW_SELECTOR)
+
+    for data in extract_rows(page, MANAGER_ROW_SELECTOR):
+        if data["rowindex"] == "0":
+            continue
+
+        manager = build_manager(data["cells"])
+        manager_name = manager["Creator Network manager"]
+        if not manager_name or manager_name.lower() == "creator network manager":
+            continue
+
+        yield manager, rows.nth(data["index"])
+
+
+def iter_manager_rows_network(page, collector):
+    for item in collector.take("manager"):
+        manager = manager_from_api(item)
+        manager_name = manager["Creator Network manager"]
+        if not manager_name:
+            continue
+        yield manager, find_manager_row(page, manager_name)
+
+
+def scrape_creator_page_dom(page, manager, identities=None):
+    crows = page.locator(CREATOR_ROW_SELECTOR)
+
+    for data in extract_rows(page, CREATOR_ROW_SELECTOR):
+        creator_name = data["cells"].get("1", "")
+
+        if not creator_name or creator_name.lower() == "creator":
+            continue
+
+        crow = crows.nth(data["index"])
+        creator_xhr = lookup_creator_identity(
+            page, crow, manager["Creator Network manager"], creator_name, identities
+        )
+        if creator_xhr is None:
+            continue
+
+        cells = {
+            column: data["cells"].get(i, "") for i, column in CREATOR_COLUMNS.items()
+        }
+        manager["creators"].append(build_creator(creator_name, cells, creator_xhr))
+
+        if len(manager["creators"]) % 50 == 0:
+            print(f"⏸ creator break (pace x{pacer.factor:.2f})")
+            human_delay(2000, 2000)
+
+
+def scrape_creator_page_network(page, manager, collector, identities=None):
+    manager_name = manager["Creator Network manager"]
+
+    for item in collector.take("creator"):
+        creator = creator_from_api(item)
+        if not creator["Creator"]:
+            continue
+
+        if creator["CreatorID"] in ("", "N/A"):
+            # list row carried no identity -> cache, then the avatar hover
+            crow = find_creator_row(page, creator["Creator"])
+            creator_xhr = lookup_creator_identity(
+                page, crow, manager_name, creator["Creator"], identities
+            )
+            if creator_xhr is None:
+                continue
+            cells = {column: creator[column] for column in CREATOR_API_FIELDS}
+            creator = build_creator(creator["Creator"], cells, creator_xhr)
+        elif identities:
+            identities.put(manager_name, creator["Creator"], normalize_creator(item))
+
+        manager["creators"].append(creator)
+
+
+def scrape_sheet_page(page, manager, collector, identities, sheet_page):
+    """
+    Read one sidesheet page with up to SHEET_PAGE_RETRIES attempts.
+    A network-mode retry reads the DOM, the list response is already gone.
+    """
+    for attempt in range(1, SHEET_PAGE_RETRIES + 1):
+        before = len(manager["creators"])
+        try:
+            with telemetry.stage("sheet_page", page=sheet_page, attempt=attempt) as tags:
+                if collector and attempt == 1:
+                    scrape_creator_page_network(page, manager, collector, identities)
+                else:
+                    scrape_creator_page_dom(page, manager, identities)
+                tags["creators"] = len(manager["creators"]) - before
+            telemetry.count("creators", len(manager["creators"]) - before)
+            return
+        except Exception as e:
+            del manager["creators"][before:]
+            if attempt == SHEET_PAGE_RETRIES:
+                raise
+            telemetry.count("sheet_page_retries")
+            print(
+                f"⚠️ {manager['Creator Network manager']} sidesheet page "
+                f"{sheet_page} attempt {attempt}/{SHEET_PAGE_RETRIES} failed: {e}"
             )
+            wait_for_rows(page, CREATOR_ROW_SELECTOR)
 
-            page = ctx.new_page()
-            page.goto(DASHBOARD_URL)
-            page.wait_for_selector('[role="row"][aria-rowindex]')
-            time.sleep(2)
 
-            while True:
-                print(f"\n📄 Manager page {manager_page}")
+def scrape_sidesheet(page, manager, collector=None, run=None):
+    manager_name = manager["Creator Network manager"]
+    identities = run.identities if run else None
+    sheet_page = 1
+    signature = None
 
-                rows = page.locator("tbody.semi-table-tbody > tr")
-                row_count = rows.count()
-
-                for i in range(row_count):
-                    row = rows.nth(i)
-                    manager_name = safe_text(row.locator('[aria-colindex="2"]'))
-                    aria_index = row.get_attribute("aria-rowindex")
-                    if aria_index == "0":
-                        continue
-
-                    if (
-                        not manager_name
-                        or manager_name.lower() == "creator network manager"
-                    ):
-                        continue
-
-                    print("➡️", manager_name)
-
-                    eligible = safe_text(row.locator('[aria-colindex="3"]'))
-
-                    manager = {
-                        "Creator Network manager": manager_name,
-                        "Eligible creators": eligible,
-                        "Estimated bonus contribution": safe_text(
-                            row.locator('[aria-colindex="4"]')
-                        ),
-                        "Diamonds": safe_text(row.locator('[aria-colindex="5"]')),
-                        "M0.5": safe_text(row.locator('[aria-colindex="6"]')),
-                        "M1": safe_text(row.locator('[aria-colindex="7"]')),
-                        "M2": safe_text(row.locator('[aria-colindex="8"]')),
-                        "M1R": safe_text(row.locator('[aria-colindex="9"]')),
-                        "creators": [],
-                    }
+    while True:
+        signature = wait_for_rows(page, CREATOR_ROW_SELECTOR, signature)
+
+        restored = run.sheet_page_done(manager_name, sheet_page) if run else None
+        if restored is not None:
+            # finished before the crash -> take creators from the checkpoint
+            manager["creators"].extend(restored)
+        else:
+            before = len(manager["creators"])
+            scrape_sheet_page(page, manager, collector, identities, sheet_page)
+            if run:
+                run.finish_sheet_page(
+                    manager_name, sheet_page, manager["creators"][before:]
+                )
+
+        next_btn = page.locator(
+            '[role="dialog"] .semi-page-next,' " .semi-sidesheet .semi-page-next"
+        ).first
+
+        if not next_btn.count() or next_btn.get_attribute("aria-disabled") == "true":
+            break
+
+        if collector:
+            collector.clear("creator")
+        next_btn.click()
+        sheet_page += 1
+        human_delay(1200, 1800)
+
+
+def should_block(request):
+    if request.resource_type in BLOCK_RESOURCE_TYPES:
+        return True
+    return any(pattern in request.url for pattern in BLOCK_URL_PATTERNS)
+
+
+def block_heavy_requests(route):
+    if should_block(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def launch_browser(p, profile=None):
+    profile = LAUNCH_PROFILES[profile or LAUNCH_PROFILE]
+    # return p.chromium.launch(headless=False, args=profile["args"])
+    return watchdog.launch(
+        lambda: p.chromium.launch(headless=True, args=profile["args"])
+    )
+
+
+def close_browser(browser):
+    watchdog.forget(browser)
+    try:
+        browser.close()
+    except Exception:
+        pass  # killed by the watchdog / already gone
 
-                    scrape_succeeded = True
-                    if eligible == "0":
-                        # final_data.append(manager)
-                        if on_manager:
-                            on_manager(manager)
-                        else:
-                            final_data.append(manager)
-
-                        save_progress(final_data)
-                        continue
-
-                    btn = row.locator('[aria-colindex="3"] button')
-                    if not btn.count():
-                        # final_data.append(manager)
-                        if on_manager:
-                            on_manager(manager)
-                        else:
-                            final_data.append(manager)
-                        save_progress(final_data)
-                        continue
-
-                    btn.click()
-                    human_delay(1200, 1800)
-
-                    try:
-                        page.wait_for_selector(
-                            '[role="dialog"], .semi-sidesheet, .semi-modal',
-                            timeout=5000,
-                        )
-                    except:
-                        # final_data.append(manager)
-                        if on_manager:
-                            on_manager(manager)
-                        else:
-                            final_data.append(manager)
-                        save_progress(final_data)
-                        continue
-
-                    creator_counter = 0
-
-                    while True:
-                        page.wait_for_timeout(800)
-
-                        crows = page.locator(
-                            '[role="dialog"] [role="row"][aria-rowindex],'
-                            ' .semi-sidesheet [role="row"][aria-rowindex]'
-                        )
-
-                        for j in range(crows.count()):
-                            crow = crows.nth(j)
-                            creator_name = safe_text(
-                                crow.locator('[aria-colindex="1"]')
-                            )
-
-                            if not creator_name or creator_name.lower() == "creator":
-                                continue
-
-                            crow.scroll_into_view_if_needed()
-                            page.mouse.move(0, 0)
-                            page.wait_for_timeout(150)
-
-                            creator_xhr = {}
-
-                            try:
-                                with page.expect_response(
-                                    lambda r: "anchor_profile" in r.url,
-                                    timeout=5000,
-                                ) as resp:
-                                    crow.locator("span.avatarContainer-yJA0K2").hover(
-                                        force=True
-                                    )
-
-                                response = resp.value
-                                text = response.text()
-                                status = response.status
-
-                                if status != 200:
-                                    print(
-                                        f"❌ Non-200 response ({status}) for {creator_name}"
-                                    )
-                                    print(text[:300])
-                                    continue  # skip this creator
-
-                                if not text.strip():
-                                    print(f"⚠️ Empty response body for {creator_name}")
-                                    continue  # skip
-
-                                try:
-                                    data = response.json()
-                                except Exception as e:
-                                    print(
-                                        f"❌ JSON decode failed for {creator_name}: {e}"
-                                    )
-                                    print("Response preview:", text[:300])
-                                    continue
-
-                                creator_xhr = normalize_creator(data)
-
-                                print(
-                                    f" XHR OK: {creator_xhr.get('AgentName')} | "
-                                    f"{creator_xhr.get('CreatorID')}"
-                                )
-
-                            except TimeoutError:
-                                print("⚠️ XHR timeout:", creator_name)
-
-                            creator_data = {
-                                "CreatorID": creator_xhr.get("CreatorID", "N/A"),
-                                "ManagerEmail": creator_xhr.get("AgentName", "N/A"),
-                                "Creator": creator_name,
-                                "Estimated bonus contribution": safe_text(
-                                    crow.locator('[aria-colindex="2"]')
-                                ),
-                                "Achieved milestones": safe_text(
-                                    crow.locator('[aria-colindex="3"]')
-                                ),
-                                "Diamonds": safe_text(
-                                    crow.locator('[aria-colindex="4"]')
-                                ),
-                                "Valid go LIVE days": safe_text(
-                                    crow.locator('[aria-colindex="5"]')
-                                ),
-                                "LIVE duration": safe_text(
-                                    crow.locator('[aria-colindex="6"]')
-                                ),
-                                "CreatorName": creator_xhr.get("nickname", ""),
-                                "ManagerID": creator_xhr.get("AgentID", ""),
-                                "GroupName": creator_xhr.get("GroupName", ""),
-                            }
-
-                            manager["creators"].append(creator_data)
-                            save_progress(final_data)
-
-                            creator_counter += 1
-                            if creator_counter % 50 == 0:
-                                print("⏸ creator break 2s")
-                                time.sleep(2)
-
-                        next_btn = page.locator(
-                            '[role="dialog"] .semi-page-next,'
-                            " .semi-sidesheet .semi-page-next"
-                        ).first
-
-                        if (
-                            not next_btn.count()
-                            or next_btn.get_attribute("aria-disabled") == "true"
-                        ):
-                            break
-
-                        next_btn.click()
-                        human_delay(1200, 1800)
 
+def new_scraper_context(browser, profile=None):
+    profile = LAUNCH_PROFILES[profile or LAUNCH_PROFILE]
+    ctx = browser.new_context(
+        storage_state=STATE_FILE,
+        viewport=profile["viewport"],
+    )
+    if BLOCK_RESOURCE_TYPES or BLOCK_URL_PATTERNS:
+        ctx.route("**/*", block_heavy_requests)
+    return ctx
+
+
+def wait_for_dashboard(page):
+    page.wait_for_selector('[role="row"][aria-rowindex]', timeout=LOAD_DEADLINE)
+    wait_for_rows(page, MANAGER_ROW_SELECTOR)
+    try:
+        # pagination renders last, once the first list response is in
+        page.wait_for_selector(
+            "#task-v2-page .semi-page-next", state="attached", timeout=LOAD_DEADLINE
+        )
+    except TimeoutError:
+        print("⚠️ manager pagination not found")
+
+
+def open_dashboard(p, mode):
+    browser = launch_browser(p)
+    try:
+        page, collector = open_dashboard_page(browser, mode)
+    except Exception:
+        close_browser(browser)
+        raise
+    return browser, page, collector
+
+
+def open_dashboard_page(browser, mode):
+    """New context + page on `browser`, showing the first manager page."""
+    ctx = new_scraper_context(browser)
+
+    page = ctx.new_page()
+    pacer.watch(page)
+    collector = ListApiCollector(page) if mode == "network" else None
+    with watchdog.guard("dashboard", browser):
+        page.goto(DASHBOARD_URL)
+        wait_for_dashboard(page)
+    return page, collector
+
+
+def scrape_manager_creators(page, collector, run, manager, row):
+    """
+    Open the manager's sidesheet and read all creator pages into manager.
+    Raises when the sidesheet does not open or a page keeps failing.
+    """
+    btn = row.locator('[aria-colindex="3"] button')
+    if not btn.count():
+        return
+
+    if collector:
+        collector.clear("creator")
+    btn.click()
+    try:
+        page.wait_for_selector(SIDESHEET_SELECTOR, timeout=SIDESHEET_DEADLINE)
+    except TimeoutError:
+        telemetry.count("modal_open_failures")
+        raise
+
+    scrape_sidesheet(page, manager, collector, run)
+    close_modal(page)
+
+
+def scrape_manager_page(page, collector, run):
+    """
+    Scrape every manager row of the manager page currently shown.
+    Returns (managers seen, managers failed).
+    """
+    if collector:
+        manager_rows = iter_manager_rows_network(page, collector)
+    else:
+        manager_rows = iter_manager_rows_dom(page)
+
+    seen = 0
+    failed = 0
+    for manager, row in manager_rows:
+        seen += 1
+        manager_name = manager["Creator Network manager"]
+        if not run.wanted(manager_name):
+            continue
+
+        if run.is_done(manager_name):
+            print("⏭️", manager_name, "(already done)")
+            continue
+
+        if run.unchanged(manager):
+            print("⏭️", manager_name, "(unchanged)")
+            continue
+
+        print("➡️", manager_name)
+
+        if manager["Eligible creators"] == "0":
+            run.emit(manager)
+            continue
+
+        error = None
+        for attempt in range(1, MANAGER_RETRIES + 1):
+            manager["creators"] = []
+            if attempt > 1:
+                telemetry.count("manager_retries")
+            try:
+                with telemetry.stage(
+                    "manager", manager=manager_name, attempt=attempt
+                ) as tags, watchdog.guard("manager", page.context.browser):
+                    scrape_manager_creators(page, collector, run, manager, row)
+                    tags["creators"] = len(manager["creators"])
+                error = None
+                break
+            except BrowserHung as e:
+                # the page is gone; the caller restarts the browser and
+                # comes back to this manager
+                run.fail(manager, e)
+                raise
+            except Exception as e:
+                error = e
+                print(
+                    f"❌ {manager_name} attempt {attempt}/{MANAGER_RETRIES} "
+                    f"failed: {e}"
+                )
+                try:
                     close_modal(page)
-                    # final_data.append(manager)
-                    if on_manager:
-                        on_manager(manager)
-                    else:
-                        final_data.append(manager)
-                    save_progress(final_data)
-                    human_delay(800, 1200)
-
-                next_page = page.locator("#task-v2-page .semi-page-next").first
-                if (
-                    not next_page.count()
-                    or next_page.get_attribute("aria-disabled") == "true"
-                ):
+                except Exception:
+                    pass
+
+        if error is not None:
+            telemetry.count("manager_failures", manager=manager_name)
+            run.fail(manager, error)
+            failed += 1
+            continue
+
+        run.emit(manager)
+        human_delay(800, 1200)
+
+    return seen, failed
+
+
+def goto_next_manager_page(page, collector):
+    next_page = page.locator("#task-v2-page .semi-page-next").first
+    if not next_page.count() or next_page.get_attribute("aria-disabled") == "true":
+        return False
+
+    signature = rows_signature(page, MANAGER_ROW_SELECTOR)
+    if collector:
+        collector.clear("manager")
+    next_page.click()
+    wait_for_rows(page, MANAGER_ROW_SELECTOR, signature)
+    human_delay(1500, 2200)
+    return True
+
+
+def goto_manager_page(page, collector, current, target):
+    """
+    Walk the manager pagination from `current` to `target`.
+    Returns the page we ended on (smaller than target if the table ran out).
+    """
+    if target < current:
+        if collector:
+            collector.clear("manager")
+        page.goto(DASHBOARD_URL)
+        wait_for_dashboard(page)
+        current = 1
+
+    while current < target:
+        if not goto_next_manager_page(page, collector):
+            break
+        current += 1
+    return current
+
+
+class BrowserSession:
+    """
+    Browser + dashboard page of the sync scraper, with its lifecycle:
+    recycle() gives the page a fresh context, restart() a fresh browser,
+    both landing on a given manager page.
+    """
+
+    def __init__(self, p, mode):
+        self.p = p
+        self.mode = mode
+        self.browser, self.page, self.collector = open_dashboard(p, mode)
+        self.managers = 0  # managers scraped since the context was created
+
+    def _goto(self, manager_page):
+        with watchdog.guard("manager_page", self.browser):
+            return goto_manager_page(self.page, self.collector, 1, manager_page)
+
+    def recycle(self, manager_page):
+        """New context on the same browser (frees the renderer's memory)."""
+        print(f"♻️ Recycling the browser context after {self.managers} managers")
+        telemetry.count("context_recycles")
+        try:
+            self.page.context.close()
+        except Exception:
+            pass
+        self.page, self.collector = open_dashboard_page(self.browser, self.mode)
+        self.managers = 0
+        return self._goto(manager_page)
+
+    def restart(self, manager_page):
+        """New browser after the watchdog killed the old one."""
+        print(f"♻️ Restarting the browser on manager page {manager_page}")
+        telemetry.count("browser_restarts")
+        close_browser(self.browser)
+        self.browser, self.page, self.collector = open_dashboard(self.p, self.mode)
+        self.managers = 0
+        return self._goto(manager_page)
+
+    def next_page(self):
+        with watchdog.guard("manager_page", self.browser):
+            return goto_next_manager_page(self.page, self.collector)
+
+    def close(self):
+        close_browser(self.browser)
+
+
+def walk_manager_pages(session, run, manager_page=1):
+    """
+    Scrape manager pages from `manager_page` (shown now) to the last one,
+    skipping pages already finished. Returns how many pages were seen.
+    A hung browser is restarted on the page it was on; managers delivered
+    before the hang are skipped, so the page resumes at the hung manager.
+    """
+    pages_seen = 0
+    restarts = 0
+    hung = False
+    while True:
+        try:
+            if hung:
+                hung = False
+                if session.restart(manager_page) < manager_page:
                     break
+            if manager_page in run.resume.manager_pages:
+                pages_seen += 1
+            else:
+                print(f"\n📄 Manager page {manager_page}")
 
-                next_page.click()
+                with telemetry.stage("manager_page", page=manager_page) as tags:
+                    seen, failed = scrape_manager_page(
+                        session.page, session.collector, run
+                    )
+                    tags.update(managers=seen, failed=failed)
+                session.managers += seen
+                if seen:
+                    pages_seen += 1
+                    # a filtered pass never completes a page
+                    if not failed and run.only is None:
+                        run.finish_manager_page(manager_page)
+
+            if run.only is not None and not run.pending_only():
+                break
+            if RECYCLE_AFTER_MANAGERS and session.managers >= RECYCLE_AFTER_MANAGERS:
+                if session.recycle(manager_page + 1) <= manager_page:
+                    break
+            elif not session.next_page():
+                break
+            manager_page += 1
+            restarts = 0
+        except BrowserHung as e:
+            print(f"❌ {e}")
+            restarts += 1
+            if restarts > BROWSER_RESTARTS_PER_PAGE:
+                # leave the page unfinished, its failed managers are
+                # re-scraped at the end of the run
+                print(f"⚠️ Giving up on manager page {manager_page}")
                 manager_page += 1
-                human_delay(1500, 2200)
+                restarts = 0
+            hung = True
+    return pages_seen
+
+
+def retry_failed_managers(session, run):
+    """One more pass over the unfinished pages for managers that failed."""
+    print(f"\n🔁 Re-scraping {len(run.failed)} failed managers")
+    run.only = set(run.failed)
+    run.failed = {}
+
+    with watchdog.guard("dashboard", session.browser):
+        session.page.goto(DASHBOARD_URL)
+        wait_for_dashboard(session.page)
+    walk_manager_pages(session, run)
+
+    run.mark_missing()
+    run.only = None
+
+
+# ---------------- MONTHS / BACKFILL ----------------
+
+
+def month_range(first, last):
+    """["202511", "202512", "202601"] for month_range("202511", "202601")."""
+    year, month = int(first[:4]), int(first[4:6])
+    end = (int(last[:4]), int(last[4:6]))
+    if not 1 <= month <= 12 or not 1 <= end[1] <= 12 or (year, month) > end:
+        raise ValueError(f"bad month range {first}..{last}")
+
+    months = []
+    while (year, month) <= end:
+        months.append(f"{year:04d}{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def set_month(month):
+    """Point the scraper (month_str + the Month= of DASHBOARD_URL) at `month`."""
+    global month_str, DASHBOARD_URL
+    url = urlparse(DASHBOARD_URL)
+    query = [(k, v) for k, v in parse_qsl(url.query) if k != "Month"]
+    query.insert(0, ("Month", month))
+    month_str = month
+    DASHBOARD_URL = url._replace(query=urlencode(query)).geturl()
+
+
+def month_file(path, month):
+    """checkpoint.jsonl -> checkpoint_202601.jsonl (None stays None)."""
+    if not path:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}_{month}{ext}"
+
+
+@contextmanager
+def use_month(month):
+    """
+    Scrape `month` inside the block. The month gets its own checkpoint file,
+    so a backfill can be resumed month by month.
+    """
+    global CHECKPOINT_FILE
+    original_month, checkpoint_file = month_str, CHECKPOINT_FILE
+    set_month(month)
+    CHECKPOINT_FILE = month_file(checkpoint_file, month)
+    try:
+        yield month
+    finally:
+        set_month(original_month)
+        CHECKPOINT_FILE = checkpoint_file
+
+
+def scrape_months(months, on_manager_for_month=None, **kwargs):
+    """
+    Scrape several months one after the other through scrape_dashboard().
+    `on_manager_for_month(month)` returns the on_manager callback of that
+    month (None keeps the managers in memory). Returns {month: run summary}.
+    """
+    summaries = {}
+    for n, month in enumerate(months, 1):
+        print(f"\n🗓️ Month {month} ({n}/{len(months)})")
+        with use_month(month):
+            on_manager = on_manager_for_month(month) if on_manager_for_month else None
+            scrape_dashboard(on_manager=on_manager, **kwargs)
+            summaries[month] = last_run_summary
+    return summaries
 
-            browser.close()
 
-        print(f"\n✅ DONE. Total managers: {len(final_data)}")
+# ---------------- MAIN SCRAPER ----------------
+
+
+def scrape_dashboard(
+    on_manager=None,
+    mode=None,
+    workers=None,
+    resume=False,
+    incremental=None,
+    refresh_identities=False,
+    retry_failed=False,
+):
+    global scrape_succeeded
+    print("🟢 SCRAPER STARTED → load_data.py called me")
+
+    mode = mode or SCRAPE_MODE
+    workers = workers or SCRAPE_WORKERS
+    if mode == "api":
+        from scripts.api_scraper import scrape_dashboard_api
+
+        return scrape_dashboard_api(
+            on_manager, resume, incremental, refresh_identities, retry_failed
+        )
+    if workers > 1:
+        return scrape_dashboard_parallel(
+            on_manager,
+            mode,
+            workers,
+            resume,
+            incremental,
+            refresh_identities,
+            retry_failed,
+        )
+
+    MAX_RETRIES = 10
+    retry = 0
+    run = start_run(on_manager, resume, incremental, refresh_identities, retry_failed)
+    if run.only is not None and not run.only:
+        print("✅ No failed managers to retry.")
+        run.close()
+        return []
+
+    while retry < MAX_RETRIES:
+        scrape_succeeded = False
+
+        with sync_playwright() as p:
+            session = BrowserSession(p, mode)
+
+            if walk_manager_pages(session, run):
+                scrape_succeeded = True
+            if run.only is not None:
+                run.mark_missing()
+
+            if run.failed and RETRY_FAILED_AT_END:
+                retry_failed_managers(session, run)
+
+            session.close()
+
+        print(f"\n✅ DONE. Total managers: {len(run.final_data)}")
 
         if scrape_succeeded:
             break
@@ -322,6 +1833,9 @@ def scrape_dashboard(on_manager=None):
             print(f"⚠️ Retry {retry}/{MAX_RETRIES}")
             time.sleep(5)
 
+    run.close()
+    final_data = run.final_data
+
     if len(final_data) == 0:
         # print("❌ Scraper failed after max retries.")
         return []
@@ -330,5 +1844,214 @@ def scrape_dashboard(on_manager=None):
         return final_data
 
 
+# ---------------- PARALLEL SCRAPER ----------------
+
+
+class ManagerPageQueue:
+    """
+    Shared work queue of manager page numbers for the worker pool.
+    Pages are handed out in order; a failed page is put back (up to
+    max_attempts) so another worker can pick it up.
+    """
+
+    def __init__(self, max_attempts=3, skip=None):
+        self.lock = threading.Lock()
+        self.skip = set(skip or ())
+        self.next_page = 1
+        self.last_page = None
+        self.retry_pages = []
+        self.attempts = {}
+        self.max_attempts = max_attempts
+        self.failed_pages = []
+
+    def claim(self):
+        with self.lock:
+            if self.retry_pages:
+                return self.retry_pages.pop(0)
+            while self.next_page in self.skip:
+                self.next_page += 1
+            if self.last_page is not None and self.next_page > self.last_page:
+                return None
+            n = self.next_page
+            self.next_page += 1
+            return n
+
+    def mark_last(self, n):
+        with self.lock:
+            if self.last_page is None or n < self.last_page:
+                self.last_page = n
+
+    def fail(self, n):
+        with self.lock:
+            self.attempts[n] = self.attempts.get(n, 0) + 1
+            if self.attempts[n] < self.max_attempts:
+                self.retry_pages.append(n)
+            else:
+                self.failed_pages.append(n)
+
+
+def _manager_worker(worker_id, queue, mode, run):
+    with sync_playwright() as p:
+        browser, page, collector = open_dashboard(p, mode)
+        current = 1
+        managers = 0  # since the context was created
+
+        while True:
+            n = queue.claim()
+            if n is None:
+                break
+
+            try:
+                if RECYCLE_AFTER_MANAGERS and managers >= RECYCLE_AFTER_MANAGERS:
+                    print(f"♻️ [worker {worker_id}] Recycling the browser context")
+                    telemetry.count("context_recycles")
+                    page.context.close()
+                    page, collector = open_dashboard_page(browser, mode)
+                    current = 1
+                    managers = 0
+
+                with watchdog.guard("manager_page", browser):
+                    current = goto_manager_page(page, collector, current, n)
+                if current < n:
+                    # table ran out before page n -> nothing left past here
+                    queue.mark_last(current)
+                    continue
+
+                print(f"\n📄 [worker {worker_id}] Manager page {n}")
+                seen, failed = scrape_manager_page(page, collector, run)
+                managers += seen
+                if seen and not failed and run.only is None:
+                    run.finish_manager_page(n)
+            except Exception as e:
+                print(f"❌ [worker {worker_id}] Manager page {n} failed: {e}")
+                if isinstance(e, BrowserHung):
+                    telemetry.count("browser_restarts")
+                queue.fail(n)
+                close_browser(browser)
+                browser, page, collector = open_dashboard(p, mode)
+                current = 1
+                managers = 0
+
+        close_browser(browser)
+
+
+def _run_pool(run, mode, workers):
+    queue = ManagerPageQueue(skip=run.resume.manager_pages)
+    threads = [
+        threading.Thread(
+            target=_manager_worker,
+            args=(i + 1, queue, mode, run),
+            name=f"scraper-{i + 1}",
+        )
+        for i in range(workers)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if queue.failed_pages:
+        print(f"⚠️ Manager pages failed after retries: {sorted(queue.failed_pages)}")
+
+
+def scrape_dashboard_parallel(
+    on_manager=None,
+    mode=None,
+    workers=None,
+    resume=False,
+    incremental=None,
+    refresh_identities=False,
+    retry_failed=False,
+):
+    """
+    Same output contract as scrape_dashboard(), but manager pages are spread
+    over a pool of browser contexts (one per worker thread, all built from
+    STATE_FILE). on_manager is called from the workers one at a time.
+    """
+    mode = mode or SCRAPE_MODE
+    workers = workers or SCRAPE_WORKERS
+    print(f"🧵 Parallel scrape with {workers} workers")
+
+    run = start_run(on_manager, resume, incremental, refresh_identities, retry_failed)
+    if run.only is not None and not run.only:
+        print("✅ No failed managers to retry.")
+        run.close()
+        return []
+
+    _run_pool(run, mode, workers)
+    if run.only is not None:
+        run.mark_missing()
+
+    if run.failed and RETRY_FAILED_AT_END:
+        print(f"\n🔁 Re-scraping {len(run.failed)} failed managers")
+        run.only = set(run.failed)
+        run.failed = {}
+        _run_pool(run, mode, workers)
+        run.mark_missing()
+        run.only = None
+
+    run.close()
+
+    print(f"\n✅ DONE. Total managers: {len(run.final_data)}")
+    return run.final_data
+
+
 if __name__ == "__main__":
-    scrape_dashboard()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scrape the Backstage dashboard")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip managers / pages already in CHECKPOINT_FILE",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="skip sidesheets of managers whose summary row did not change",
+    )
+    parser.add_argument(
+        "--refresh-identities",
+        action="store_true",
+        help="ignore the identity cache and re-read every creator profile",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="only re-scrape the managers that failed in the last run",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["dom", "network", "api"],
+        help="how manager / creator rows are read (default: SCRAPE_MODE)",
+    )
+    parser.add_argument(
+        "--lean",
+        action="store_true",
+        help="use the lean browser profile (small viewport, no GPU/extensions)",
+    )
+    parser.add_argument("--month", help="scrape this month (YYYYMM)")
+    parser.add_argument(
+        "--months",
+        metavar="FIRST:LAST",
+        help="backfill every month from FIRST to LAST (YYYYMM:YYYYMM)",
+    )
+    args = parser.parse_args()
+
+    if args.lean:
+        LAUNCH_PROFILE = "lean"
+    options = dict(
+        mode=args.mode,
+        resume=args.resume,
+        incremental=args.incremental or None,
+        refresh_identities=args.refresh_identities,
+        retry_failed=args.retry_failed,
+    )
+    if args.months:
+        first, _, last = args.months.partition(":")
+        scrape_months(month_range(first, last or first), **options)
+    elif args.month:
+        with use_month(args.month):
+            scrape_dashboard(**options)
+    else:
+        scrape_dashboard(**options)